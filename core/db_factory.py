@@ -89,7 +89,7 @@ class PostgresDB(Database):
 
 
 class SQLiteDB(Database):
-    """SQLite backend using :pymod:`sqlite3` with ``row_factory`` for dict rows."""
+    """SQLite backend using :pymod:`sqlite3`; rows are zipped into dicts."""
 
     def __init__(self, db_path: str):
         self._db_path = db_path
@@ -102,7 +102,6 @@ class SQLiteDB(Database):
             first_run = not Path(self._db_path).exists()
 
             self._conn = sqlite3.connect(self._db_path)
-            self._conn.row_factory = sqlite3.Row
 
             if first_run:
                 base_dir = Path(__file__).resolve().parent.parent  # → ids/
@@ -116,7 +115,9 @@ class SQLiteDB(Database):
             raise RuntimeError("Connection is not open – call connect() first")
         cur = self._conn.cursor()
         cur.execute(sql)
-        return [dict(row) for row in cur.fetchall()]
+        # Plain tuples + column names read once: dict(zip()) stays in C
+        keys = tuple(col[0] for col in cur.description or ())
+        return [dict(zip(keys, row)) for row in cur.fetchall()]
 
     def close(self) -> None:  # noqa: D401
         """Close database file if open."""
@@ -16,10 +16,10 @@ from __future__ import annotations
 
 import datetime as dt
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 import pyshark
 
@@ -104,6 +104,28 @@ class SynFloodDetector(BaseDetector):
             pass
         return alerts
 
+    def inspect_many(self, packets: Iterable) -> List[Tuple[str, str]]:
+        """Batch variant of :meth:`inspect`.
+
+        Counts SYNs per source across the whole batch first, then checks the
+        threshold once per source, so each offender is reported at most once.
+        """
+        self._rotate_window()
+        batch: Counter = Counter()
+        for packet in packets:
+            try:
+                if packet.tcp.flags == "0x0002":  # SYN flag only
+                    batch[packet.ip.src] += 1
+            except AttributeError:
+                continue
+
+        alerts: List[Tuple[str, str]] = []
+        for src, count in batch.items():
+            self.syn_counts[src] += count
+            if self.syn_counts[src] > self.THRESHOLD:
+                alerts.append((f"SYN flood from {src}", "SynFlood"))
+        return alerts
+
 
 # --------------------------------------------------------------------- #
 # URL model-based detector (supervised)
@@ -210,10 +232,19 @@ class ModelBasedBehaviourDetector(BaseDetector):
 # Engine
 # --------------------------------------------------------------------- #
 class DetectorEngine:
-    """Aggregates detectors and handles alert side-effects."""
+    """Aggregates detectors and handles alert side-effects.
+
+    Alert rows go to ``db.insert_alert`` unless an *alert_sink* callable is
+    given, e.g. to hand them to a batching background writer.
+    """
 
-    def __init__(self, detectors: Sequence[BaseDetector]):
+    def __init__(
+        self,
+        detectors: Sequence[BaseDetector],
+        alert_sink: Optional[Callable[[dict[str, Any]], None]] = None,
+    ):
         self.detectors = list(detectors)
+        self.alert_sink = alert_sink
 
     def inspect(self, packet):
         collected: List[Tuple[str, str]] = []
@@ -225,9 +256,10 @@ class DetectorEngine:
                 else:
                     collected.append((outcome, det.__class__.__name__))
 
+        persist = self.alert_sink or db.insert_alert
         for msg, model_used in collected:
-            # Persist to DB
-            db.insert_alert(
+            # Persist to DB (directly or via the configured sink)
+            persist(
                 {
                     "ts": dt.datetime.utcnow(),
                     "alert_type": msg.split()[0],
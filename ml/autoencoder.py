@@ -2,7 +2,6 @@
 from pathlib import Path
 import datetime as dt
 
-import joblib
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
@@ -12,7 +11,7 @@ from tensorflow import keras
 from tensorflow.keras import layers
 
 from ids.core import config
-from .base import BaseAnomalyModel
+from .base import BaseAnomalyModel, atomic_dump, atomic_path
 
 class AutoencoderModel(BaseAnomalyModel):
     """Denoising autoencoder for anomaly detection.
@@ -62,8 +61,9 @@ class AutoencoderModel(BaseAnomalyModel):
             shuffle=True,
             verbose=0,
         )
-        self._model.save(self.model_path)
-        joblib.dump(self._scaler, self.scaler_path)
+        with atomic_path(self.model_path) as tmp:
+            self._model.save(tmp)
+        atomic_dump(self._scaler, self.scaler_path)
 
     def reconstruction_error(self, X: np.ndarray) -> np.ndarray:
         X_scaled = self._scaler.transform(X)
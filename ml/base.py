@@ -1,10 +1,13 @@
 """Abstract base class for anomaly‑detection models used in IDS."""
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+import joblib
 import numpy as np
 
 class BaseAnomalyModel(ABC):
@@ -19,6 +22,8 @@ class BaseAnomalyModel(ABC):
       returns a :class:`pathlib.Path` to the saved PNG so the UI can embed it.
     * ``score_samples`` is optional but recommended if the algorithm provides a
       continuous anomaly score.
+    * :meth:`train_and_plot_iter` takes the data as an iterator of chunks; the
+      default stacks them, models that can learn from a sample override it.
     """
 
     # ------------------------------------------------------------------
@@ -39,6 +44,13 @@ class BaseAnomalyModel(ABC):
     # ------------------------------------------------------------------
     # Optional helpers – subclasses may override or rely on these defaults
     # ------------------------------------------------------------------
+    def train_and_plot_iter(self, chunks: Iterable[np.ndarray], *, save_dir: Path) -> Path:
+        """Like :meth:`train_and_plot`, but fed row chunks of the training data."""
+        parts = list(chunks)
+        if not parts:
+            raise ValueError("no training data")
+        return self.train_and_plot(np.vstack(parts), save_dir=save_dir)
+
     def score_samples(self, X: np.ndarray) -> np.ndarray:  # pragma: no cover
         """Return raw anomaly scores if the underlying algorithm supports it.
 
@@ -56,4 +68,50 @@ class BaseAnomalyModel(ABC):
             k: v for k, v in self.__dict__.items() if not k.startswith("_")
         }
         param_str = ", ".join(f"{k}={v!r}" for k, v in params.items())
-        return f"{self.__class__.__name__}({param_str})"
\ No newline at end of file
+        return f"{self.__class__.__name__}({param_str})"
+
+
+def reservoir_sample(
+    chunks: Iterable[np.ndarray], size: int, *, random_state: int | None = None
+) -> np.ndarray:
+    """Uniform sample of at most *size* rows drawn from a stream of chunks.
+
+    Every row gets a random key and the *size* smallest keys survive, so only
+    ``size`` rows plus the current chunk are held in memory.
+    """
+    rng = np.random.default_rng(random_state)
+    sample: np.ndarray | None = None
+    keys = np.empty(0)
+    for chunk in chunks:
+        chunk_keys = rng.random(len(chunk))
+        if sample is None:
+            sample, keys = chunk, chunk_keys
+        else:
+            sample, keys = np.vstack([sample, chunk]), np.concatenate([keys, chunk_keys])
+        if len(keys) > size:
+            keep = np.argpartition(keys, size)[:size]
+            sample, keys = sample[keep], keys[keep]
+    if sample is None:
+        raise ValueError("no training data")
+    return sample
+
+
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    """Yield a temporary sibling of *path* that replaces it on success.
+
+    ``os.replace`` is atomic, so readers (including processes that have the
+    old file memory-mapped) never see a half-written model.
+    """
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp{path.suffix}")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def atomic_dump(obj: Any, path: Path, **kwargs: Any) -> None:
+    """``joblib.dump`` *obj* to *path* via :func:`atomic_path`."""
+    with atomic_path(path) as tmp:
+        joblib.dump(obj, tmp, **kwargs)
@@ -11,6 +11,12 @@ must implement at least the following abstract methods:
 * :meth:`predict` – return integer / string labels for unseen *X*
 * :meth:`train_and_plot` – helper that trains the model **and** saves a
   diagnostic figure (e.g. confusion‑matrix heat‑map); returns the PNG path.
+  With ``save_dir=None`` nothing is written and the PNG bytes are returned
+  instead (see :meth:`train_and_return_png` and :func:`png_bytes`).
+
+:meth:`train_and_plot_iter` accepts the data as an iterator of ``(X, y)``
+chunks (e.g. ``pd.read_csv(..., chunksize=…)``). Its default simply joins the
+chunks; models that support ``partial_fit`` override it to learn out of core.
 
 The optional :meth:`predict_proba` should be overridden if the underlying
 algorithm exposes class probabilities (e.g. Random Forest, Logistic
@@ -18,15 +24,44 @@ Regression). The default implementation raises *NotImplementedError*.
 
 Sub‑classes are free to expose additional helpers (e.g. *score*,
 *feature_importances_*) as needed.
+
+:func:`url_vectorizer` is the shared, stateless URL featuriser: hashed
+character n‑grams need no fitted vocabulary, so pipelines pickle small and
+can also be trained chunk by chunk.
 """
 
 from __future__ import annotations
 
+import io
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
+import matplotlib.pyplot as plt
 import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+
+def url_vectorizer(n_features: int = 2**18) -> HashingVectorizer:
+    """Return the hashed char 3‑5‑gram vectoriser used by the URL models.
+
+    Output rows are already L2-normalised, like TF‑IDF's (without the IDF
+    weighting, which would need a pass over the whole corpus).
+    """
+    return HashingVectorizer(
+        analyzer="char_wb",
+        ngram_range=(3, 5),
+        n_features=n_features,
+        alternate_sign=False,
+    )
+
+
+def png_bytes(fig, dpi: int = 100) -> bytes:
+    """Render *fig* to PNG in memory and close it."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi)
+    plt.close(fig)
+    return buf.getvalue()
 
 
 class BaseClassifierModel(ABC):
@@ -45,13 +80,43 @@ class BaseClassifierModel(ABC):
 
     @abstractmethod
     def train_and_plot(
-        self, X: np.ndarray, y: np.ndarray, *, save_dir: Path
+        self, X: np.ndarray, y: np.ndarray, *, save_dir: Path | None
     ) -> Path:  # pragma: no cover
-        """Train model, create a diagnostic plot, save it into *save_dir* and return the path."""
+        """Train model, create a diagnostic plot, save it into *save_dir* and return the path.
+
+        When *save_dir* is ``None`` the plot's PNG bytes are returned instead.
+        """
 
     # ------------------------------------------------------------------
     # Optional helpers – subclasses may override or rely on these defaults
     # ------------------------------------------------------------------
+    def train_and_plot_iter(
+        self,
+        chunks: Iterable[tuple[Any, Any]],
+        *,
+        save_dir: Path | None,
+        classes: Sequence[Any] | None = None,
+    ) -> Any:
+        """Like :meth:`train_and_plot`, but fed ``(X, y)`` chunks.
+
+        *classes* lists every label up-front, which incremental learners need
+        for their first ``partial_fit``; the default implementation ignores it.
+        """
+        parts = list(chunks)
+        if not parts:
+            raise ValueError("no training data")
+        X = np.concatenate([np.asarray(X_part, dtype=object) for X_part, _ in parts])
+        y = np.concatenate([np.asarray(y_part, dtype=object) for _, y_part in parts])
+        return self.train_and_plot(X, y, save_dir=save_dir)
+
+    def train_and_return_png(self, X: np.ndarray, y: np.ndarray) -> bytes:
+        """Train on *X*/*y* and return the first diagnostic plot as PNG bytes.
+
+        Nothing is written to disk; the caller decides whether to keep it.
+        """
+        plots = self.train_and_plot(X, y, save_dir=None)
+        return plots[0] if isinstance(plots, tuple) else plots
+
     def predict_proba(self, X: np.ndarray) -> np.ndarray:  # pragma: no cover
         """Return class probabilities if supported by the underlying algorithm.
 
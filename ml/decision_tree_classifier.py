@@ -14,7 +14,6 @@ import joblib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import (
     ConfusionMatrixDisplay,
     RocCurveDisplay,
@@ -40,16 +39,23 @@ except Exception:
     MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
 try:
-    from base_classifier import BaseClassifierModel
+    from base import atomic_dump
+    from base_classifier import BaseClassifierModel, png_bytes, url_vectorizer
 except ImportError:
-    from .base_classifier import BaseClassifierModel  # type: ignore
+    from .base import atomic_dump  # type: ignore
+    from .base_classifier import BaseClassifierModel, png_bytes, url_vectorizer  # type: ignore
 
 # ----------------------------------------------------------------------
 # Helper utilities
 # ----------------------------------------------------------------------
 
-def _plot_and_save(fig, save_dir: Path, name: str) -> Path:
-    """Save *fig* as *name*_<UTCtimestamp>.png inside *save_dir* and close the fig."""
+def _plot_and_save(fig, save_dir: Path | None, name: str) -> Path | bytes:
+    """Save *fig* as *name*_<UTCtimestamp>.png inside *save_dir* and close the fig.
+
+    With no *save_dir* nothing is written; the PNG bytes are returned.
+    """
+    if save_dir is None:
+        return png_bytes(fig)
     save_dir.mkdir(parents=True, exist_ok=True)
     png_path = save_dir / f"{name}_{dt.datetime.utcnow():%Y%m%dT%H%M%S}.png"
     fig.savefig(png_path, dpi=150)
@@ -64,11 +70,7 @@ class DecisionTreeURLModel(BaseClassifierModel):
     """Decision‑Tree URL classifier with visual metrics export."""
 
     def __init__(self, **clf_kwargs):
-        self.vectorizer = TfidfVectorizer(
-            analyzer="char",
-            ngram_range=(3, 5),
-            max_features=50_000,  # cap dimensionality
-        )
+        self.vectorizer = url_vectorizer()  # stateless: no vocabulary to pickle
         default_params = dict(max_depth=25, min_samples_leaf=5, random_state=42)
         default_params.update(clf_kwargs)
         self.classifier = DecisionTreeClassifier(**default_params)
@@ -89,7 +91,7 @@ class DecisionTreeURLModel(BaseClassifierModel):
         self._pipeline.fit(X, y)
         toc = time.perf_counter()
         print(f"[INFO] Training finished in {toc - tic:,.1f}s", flush=True)
-        joblib.dump(self._pipeline, self.model_path, compress=3)
+        atomic_dump(self._pipeline, self.model_path)  # uncompressed: loadable with mmap_mode
 
     def predict(self, X: Sequence[str]):
         return self._pipeline.predict(X)
@@ -98,7 +100,7 @@ class DecisionTreeURLModel(BaseClassifierModel):
         return self._pipeline.predict_proba(X)
 
     # -------------------- Private visual helpers --------------------
-    def _plot_confusion_matrix(self, y_true, y_pred, labels, save_dir: Path) -> Path:
+    def _plot_confusion_matrix(self, y_true, y_pred, labels, save_dir: Path | None) -> Path | bytes:
         cm = confusion_matrix(y_true, y_pred, labels=labels)
         disp = ConfusionMatrixDisplay(confusion_matrix=cm, display_labels=labels)
         fig, ax = plt.subplots(figsize=(6, 5))
@@ -107,7 +109,7 @@ class DecisionTreeURLModel(BaseClassifierModel):
         plt.tight_layout()
         return _plot_and_save(fig, save_dir, "decision_tree_confusion_matrix")
 
-    def _plot_roc_auc(self, y_true, probs, classes, save_dir: Path) -> Path:
+    def _plot_roc_auc(self, y_true, probs, classes, save_dir: Path | None) -> Path | bytes:
         """Plot ROC curves & compute AUC (binary or multi‑class)."""
         fig, ax = plt.subplots(figsize=(6, 5))
 
@@ -147,9 +149,8 @@ class DecisionTreeURLModel(BaseClassifierModel):
         return _plot_and_save(fig, save_dir, "decision_tree_roc_auc")
 
     # -------------------- High‑level convenience --------------------
-    def train_and_plot(self, X: Sequence[str], y: Sequence[str], *, save_dir: Path) -> tuple[Path, Path]:
+    def train_and_plot(self, X: Sequence[str], y: Sequence[str], *, save_dir: Path | None) -> tuple[Path | bytes, Path | bytes]:
         """Train‑test split, train model, export Confusion‑Matrix & ROC‑AUC plots."""
-        save_dir.mkdir(parents=True, exist_ok=True)
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.3, stratify=y, random_state=42
         )
@@ -171,7 +172,7 @@ class DecisionTreeURLModel(BaseClassifierModel):
     # ---------------------- Loader ------------------------
     @classmethod
     def load(cls):
-        pipeline = joblib.load(MODEL_DIR / "decision_tree.pkl")
+        pipeline = joblib.load(MODEL_DIR / "decision_tree.pkl", mmap_mode="r")
         instance = cls.__new__(cls)  # type: ignore
         instance._pipeline = pipeline
         return instance
@@ -197,7 +198,9 @@ if __name__ == "__main__":
     if not csv_path.exists():
         raise FileNotFoundError(csv_path)
 
-    df = pd.read_csv(csv_path)
+    # Arrow parser + Arrow-backed strings: no per-row PyUnicode objects
+    df = pd.read_csv(csv_path, usecols=["url", "type"],
+                     engine="pyarrow", dtype_backend="pyarrow")
     model = DecisionTreeURLModel()
     cm_png, roc_png = model.train_and_plot(df["url"], df["type"], save_dir= csv_path.parent.parent / "web" / "static" / "training_results" / "supervised"
     )
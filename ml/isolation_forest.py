@@ -1,8 +1,8 @@
 """Isolation Forest anomaly detection model wrapper."""
 from pathlib import Path
+from typing import Iterable, Iterator
 import datetime as dt
 
-import joblib
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
@@ -11,7 +11,7 @@ from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
 from mpl_toolkits.mplot3d import Axes3D
 from ids.core import config
-from .base import BaseAnomalyModel
+from .base import BaseAnomalyModel, atomic_dump, reservoir_sample
 
 class IsolationForestModel(BaseAnomalyModel):
     """Isolation‑Forest based anomaly detector.
@@ -21,6 +21,8 @@ class IsolationForestModel(BaseAnomalyModel):
     * Provides helpers to score new samples and create a diagnostic plot.
     """
 
+    RESERVOIR_SIZE = 100_000  # rows kept when training from a chunk stream
+
     def __init__(self, *, n_estimators: int = 100, contamination: float = 0.01, random_state: int = 42):
         self.n_estimators = n_estimators
         self.contamination = contamination
@@ -46,7 +48,7 @@ class IsolationForestModel(BaseAnomalyModel):
         """Fit scaler and IsolationForest on *X* (shape: [n_samples, n_features])."""
         X_scaled = self._scaler.fit_transform(X)
         self._model.fit(X_scaled)
-        joblib.dump({"scaler": self._scaler, "model": self._model}, self.model_path)
+        atomic_dump({"scaler": self._scaler, "model": self._model}, self.model_path)
 
     def score_samples(self, X: np.ndarray) -> np.ndarray:
         """Return anomaly scores (higher = more normal)."""
@@ -59,9 +61,29 @@ class IsolationForestModel(BaseAnomalyModel):
         return self._model.predict(X_scaled)
 
     def train_and_plot(self, X: np.ndarray, *, save_dir: Path) -> Path:
-        save_dir.mkdir(parents=True, exist_ok=True)
         self.train(X)
-        preds = self.predict(X)
+        return self._plot(X, self.predict(X), save_dir)
+
+    def train_and_plot_iter(self, chunks: Iterable[np.ndarray], *, save_dir: Path) -> Path:
+        """Fit the scaler on every chunk and the forest on a uniform sample.
+
+        Each tree only draws ``max_samples`` rows anyway, so a bounded
+        reservoir of the stream gives the same model without holding it all.
+        """
+        def _fit_scaler(stream: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+            for chunk in stream:
+                self._scaler.partial_fit(chunk)
+                yield chunk
+
+        sample = reservoir_sample(
+            _fit_scaler(chunks), self.RESERVOIR_SIZE, random_state=self.random_state
+        )
+        self._model.fit(self._scaler.transform(sample))
+        atomic_dump({"scaler": self._scaler, "model": self._model}, self.model_path)
+        return self._plot(sample, self.predict(sample), save_dir)
+
+    def _plot(self, X: np.ndarray, preds: np.ndarray, save_dir: Path) -> Path:
+        save_dir.mkdir(parents=True, exist_ok=True)
 
         # Assume X has at least 3 features
         fig = plt.figure()
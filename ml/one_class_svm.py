@@ -2,14 +2,13 @@
 from pathlib import Path
 import datetime as dt
 
-import joblib
 import matplotlib.pyplot as plt
 import numpy as np
 from sklearn import svm
 from sklearn.preprocessing import StandardScaler
 
 from ids.core import config
-from .base import BaseAnomalyModel
+from .base import BaseAnomalyModel, atomic_dump
 
 class OneClassSVMModel(BaseAnomalyModel):
     """One‑Class SVM detector using RBF kernel."""
@@ -29,7 +28,7 @@ class OneClassSVMModel(BaseAnomalyModel):
     def train(self, X: np.ndarray) -> None:
         X_scaled = self._scaler.fit_transform(X)
         self._model.fit(X_scaled)
-        joblib.dump({"scaler": self._scaler, "model": self._model}, self.model_path)
+        atomic_dump({"scaler": self._scaler, "model": self._model}, self.model_path)
 
     def score_samples(self, X: np.ndarray) -> np.ndarray:
         X_scaled = self._scaler.transform(X)
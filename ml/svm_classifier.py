@@ -7,6 +7,7 @@ Shared upgrades
 * Confusion‑matrix & ROC‑AUC PNG exports plus held‑out test metrics.
 * Unified *models/* directory and clean `.load()`.
 * CLI `--csv` argument.
+* Out-of-core training (:meth:`train_and_plot_iter`) for chunked CSV reads.
 
 Expected CSV columns: **url**, **type**
 """
@@ -15,14 +16,14 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Iterable, Sequence
 import datetime as dt
 
 import joblib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import (ConfusionMatrixDisplay, RocCurveDisplay, auc,
                              classification_report, confusion_matrix, roc_curve)
 from sklearn.model_selection import train_test_split
@@ -41,15 +42,22 @@ except Exception:
     MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
 try:
-    from base_classifier import BaseClassifierModel
+    from base import atomic_dump
+    from base_classifier import BaseClassifierModel, png_bytes, url_vectorizer
 except ImportError:
-    from .base_classifier import BaseClassifierModel  # type: ignore
+    from .base import atomic_dump  # type: ignore
+    from .base_classifier import BaseClassifierModel, png_bytes, url_vectorizer  # type: ignore
 
 # ----------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------
-def _plot_and_save(fig, save_dir: Path, name: str) -> Path:
-    """Save matplotlib *fig* to *save_dir* with a UTC timestamped filename."""
+def _plot_and_save(fig, save_dir: Path | None, name: str) -> Path | bytes:
+    """Save matplotlib *fig* to *save_dir* with a UTC timestamped filename.
+
+    With no *save_dir* nothing is written; the PNG bytes are returned.
+    """
+    if save_dir is None:
+        return png_bytes(fig)
     save_dir.mkdir(parents=True, exist_ok=True)
     png_path = save_dir / f"{name}_{dt.datetime.utcnow():%Y%m%dT%H%M%S}.png"
     fig.savefig(png_path, dpi=150)
@@ -64,9 +72,7 @@ class LinearSVMURLModel(BaseClassifierModel):
     """Linear Support‑Vector‑Machine URL classifier with ROC‑AUC visualisation."""
 
     def __init__(self, **clf_kwargs):
-        self.vectorizer = TfidfVectorizer(
-            analyzer="char", ngram_range=(3, 5), max_features=50_000
-        )
+        self.vectorizer = url_vectorizer()  # stateless: no vocabulary to pickle
         default_params = {"C": 1.0, "class_weight": "balanced", "random_state": 42}
         default_params.update(clf_kwargs)
         self.classifier = LinearSVC(**default_params)
@@ -87,7 +93,7 @@ class LinearSVMURLModel(BaseClassifierModel):
         self._pipeline.fit(X, y)
         toc = time.perf_counter()
         print(f"[INFO] Training finished in {toc - tic:,.1f}s", flush=True)
-        joblib.dump(self._pipeline, self.model_path, compress=3)
+        atomic_dump(self._pipeline, self.model_path)  # uncompressed: loadable with mmap_mode
 
     def predict(self, X: Sequence[str]):
         return self._pipeline.predict(X)
@@ -100,7 +106,7 @@ class LinearSVMURLModel(BaseClassifierModel):
         raise NotImplementedError("LinearSVC does not support predict_proba – use decision_function() for scores")
 
     # ----------------------- Evaluation utilities -------------------------
-    def _plot_confusion_matrix(self, y_true, y_pred, labels, save_dir: Path) -> Path:
+    def _plot_confusion_matrix(self, y_true, y_pred, labels, save_dir: Path | None) -> Path | bytes:
         cm = confusion_matrix(y_true, y_pred, labels=labels)
         disp = ConfusionMatrixDisplay(confusion_matrix=cm, display_labels=labels)
         fig, ax = plt.subplots(figsize=(6, 5))
@@ -109,7 +115,7 @@ class LinearSVMURLModel(BaseClassifierModel):
         plt.tight_layout()
         return _plot_and_save(fig, save_dir, "linear_svm_confusion_matrix")
 
-    def _plot_roc_auc(self, y_true, scores, classes, save_dir: Path) -> Path:
+    def _plot_roc_auc(self, y_true, scores, classes, save_dir: Path | None) -> Path | bytes:
         """Plot ROC curve(s) and compute AUC for binary or multi‑class tasks."""
         fig, ax = plt.subplots(figsize=(6, 5))
 
@@ -149,15 +155,15 @@ class LinearSVMURLModel(BaseClassifierModel):
         return _plot_and_save(fig, save_dir, "linear_svm_roc_auc")
 
     # ------------------------ Public interface ---------------------------
-    def train_and_plot(self, X: Sequence[str], y: Sequence[str], *, save_dir: Path) -> tuple[Path, Path]:
+    def train_and_plot(self, X: Sequence[str], y: Sequence[str], *, save_dir: Path | None) -> tuple[Path | bytes, Path | bytes]:
         """Train‑test split, train the model and export Confusion Matrix & ROC‑AUC plots.
 
         Returns
         -------
         tuple(Path, Path)
-            Paths to the confusion‑matrix PNG and ROC‑AUC PNG respectively.
+            Paths to the confusion‑matrix PNG and ROC‑AUC PNG respectively
+            (their bytes when *save_dir* is ``None``).
         """
-        save_dir.mkdir(parents=True, exist_ok=True)
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.3, stratify=y, random_state=42
         )
@@ -175,10 +181,63 @@ class LinearSVMURLModel(BaseClassifierModel):
         print("\n[TEST‑SET METRICS]\n", classification_report(y_test, preds))
         return cm_png, roc_png
 
+    def train_and_plot_iter(
+        self,
+        chunks: Iterable[tuple[Any, Any]],
+        *,
+        save_dir: Path | None,
+        classes: Sequence[Any] | None = None,
+    ) -> tuple[Path | bytes, Path | bytes]:
+        """Out-of-core variant of :meth:`train_and_plot` over ``(X, y)`` chunks.
+
+        LinearSVC cannot learn incrementally, so the streamed model pairs the
+        same stateless vectoriser with an :class:`SGDClassifier` on hinge
+        loss – a linear SVM fitted with ``partial_fit``. 30 % of every chunk
+        is held back for the test plots.
+        *classes* must list every label; without it the first chunk's are used.
+        """
+        vectorizer = url_vectorizer()
+        classifier = SGDClassifier(loss="hinge", random_state=42)
+        rng = np.random.default_rng(42)
+        X_test_parts, y_test_parts = [], []
+
+        tic = time.perf_counter()
+        print("[INFO] Streaming training started…", flush=True)
+        for X_chunk, y_chunk in chunks:
+            X_chunk = np.asarray(X_chunk, dtype=object)
+            y_chunk = np.asarray(y_chunk, dtype=object)
+            held_out = rng.random(len(y_chunk)) < 0.3
+            X_test_parts.append(X_chunk[held_out])
+            y_test_parts.append(y_chunk[held_out])
+            if classes is None:
+                classes = np.unique(y_chunk)
+            classifier.partial_fit(
+                vectorizer.transform(X_chunk[~held_out]), y_chunk[~held_out], classes=classes
+            )
+        if not y_test_parts:
+            raise ValueError("no training data")
+        toc = time.perf_counter()
+        print(f"[INFO] Training finished in {toc - tic:,.1f}s", flush=True)
+
+        self.vectorizer, self.classifier = vectorizer, classifier
+        self._pipeline = Pipeline([("vect", vectorizer), ("clf", classifier)])
+        atomic_dump(self._pipeline, self.model_path)  # uncompressed: loadable with mmap_mode
+
+        X_test, y_test = np.concatenate(X_test_parts), np.concatenate(y_test_parts)
+        preds = self.predict(X_test)
+        scores = self._decision_function(X_test)
+
+        classes = np.asarray(classifier.classes_)
+        cm_png = self._plot_confusion_matrix(y_test, preds, classes, save_dir)
+        roc_png = self._plot_roc_auc(y_test, scores, classes, save_dir)
+
+        print("\n[TEST‑SET METRICS]\n", classification_report(y_test, preds))
+        return cm_png, roc_png
+
     # ----------------------------- Utilities -----------------------------
     @classmethod
     def load(cls):
-        pipeline = joblib.load(MODEL_DIR / "linear_svm.pkl")
+        pipeline = joblib.load(MODEL_DIR / "linear_svm.pkl", mmap_mode="r")
         instance = cls.__new__(cls)  # type: ignore
         instance._pipeline = pipeline
         return instance
@@ -202,7 +261,9 @@ if __name__ == "__main__":
     if not csv_path.exists():
         raise FileNotFoundError(csv_path)
 
-    df = pd.read_csv(csv_path)
+    # Arrow parser + Arrow-backed strings: no per-row PyUnicode objects
+    df = pd.read_csv(csv_path, usecols=["url", "type"],
+                     engine="pyarrow", dtype_backend="pyarrow")
     
     model = LinearSVMURLModel()
     cm_png, roc_png = model.train_and_plot(df["url"], df["type"], save_dir=csv_path.parent)
@@ -2,8 +2,9 @@
 --Useful for spotting hosts that send many small probes vs. large data bursts.
 SELECT
     host_ip,
-    SUM(total_packets_size)::NUMERIC / NULLIF(SUM(total_packets),0) AS avg_pkt_size_bytes,
-    SUM(total_packets)                                              AS total_pkts
+    CAST(SUM(total_packets_size)::NUMERIC / NULLIF(SUM(total_packets),0)
+         AS DOUBLE PRECISION)                                       AS avg_pkt_size_bytes,
+    CAST(SUM(total_packets) AS BIGINT)                              AS total_pkts
 FROM   host_stats
 GROUP  BY host_ip
 ORDER  BY avg_pkt_size_bytes DESC;
\ No newline at end of file
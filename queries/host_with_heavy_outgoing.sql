@@ -10,9 +10,10 @@ WITH last_hour AS (
     GROUP  BY host_ip
 )
 SELECT host_ip,
-       in_pkts,
-       out_pkts,
-       COALESCE((ROUND(out_pkts::NUMERIC / NULLIF(in_pkts,0),2)),0) AS out_in_ratio
+       CAST(in_pkts AS BIGINT)  AS in_pkts,
+       CAST(out_pkts AS BIGINT) AS out_pkts,
+       CAST(COALESCE((ROUND(out_pkts::NUMERIC / NULLIF(in_pkts,0),2)),0)
+            AS DOUBLE PRECISION) AS out_in_ratio
 FROM   last_hour
 WHERE  out_pkts >= 1 * in_pkts         -- tweak ratio as needed
 ORDER  BY out_in_ratio DESC;
\ No newline at end of file
@@ -11,9 +11,10 @@ WITH last_two_hours AS (
     GROUP BY host_ip
 )
 SELECT host_ip,
-       in_pkts,
-       out_pkts,
-       COALESCE(ROUND(out_pkts / NULLIF(in_pkts, 0), 2), 0) AS out_in_ratio
+       CAST(in_pkts AS BIGINT)  AS in_pkts,
+       CAST(out_pkts AS BIGINT) AS out_pkts,
+       CAST(COALESCE(ROUND(out_pkts / NULLIF(in_pkts, 0), 2), 0)
+            AS DOUBLE PRECISION) AS out_in_ratio
 FROM last_two_hours
 WHERE out_pkts >= in_pkts       -- tweak ratio threshold here
 ORDER BY out_in_ratio DESC;
@@ -3,8 +3,8 @@
 -- Top “talkers” by bandwidth in the last 10 minutes (SQLite)
 SELECT
     host_ip,
-    SUM(total_packets_size) AS bytes_last_10m,
-    SUM(total_packets)      AS pkts_last_10m
+    CAST(SUM(total_packets_size) AS BIGINT) AS bytes_last_10m,
+    CAST(SUM(total_packets) AS BIGINT)      AS pkts_last_10m
 FROM host_stats
 WHERE interval_end >= datetime('now', '-1000 minutes')
 GROUP BY host_ip
@@ -2,8 +2,8 @@
 -- Shows which hosts moved the most bytes recently.
 SELECT
     host_ip,
-    SUM(total_packets_size)        AS bytes_last_10m,
-    SUM(total_packets)             AS pkts_last_10m
+    CAST(SUM(total_packets_size) AS BIGINT) AS bytes_last_10m,
+    CAST(SUM(total_packets) AS BIGINT)      AS pkts_last_10m
 FROM   host_stats
 WHERE  interval_end >= NOW() - INTERVAL '100000 minutes'
 GROUP  BY host_ip
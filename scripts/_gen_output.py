@@ -0,0 +1,35 @@
+"""Command-line and output helpers shared by the ``gen_*_data.py`` generators."""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+
+def save_frame(df: pd.DataFrame, csv_path: Path, fmt: str = "csv") -> Path:
+    """Write *df* next to *csv_path* as ``csv``, ``csv.gz`` or ``parquet``.
+
+    Returns the path actually written (the suffix follows *fmt*).
+    """
+    if fmt == "parquet":
+        out = csv_path.with_suffix(".parquet")
+        df.to_parquet(out, engine="pyarrow", compression="zstd", index=False)
+    elif fmt == "csv.gz":
+        out = csv_path.with_suffix(".csv.gz")
+        df.to_csv(out, index=False, compression="gzip")
+    else:
+        out = csv_path
+        df.to_csv(out, index=False)
+    return out
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    """Parse the generators' common options (``--format``)."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--format",
+        choices=("csv", "csv.gz", "parquet"),
+        default="csv",
+        help="Output format (default csv – the loader scripts read *.csv)",
+    )
+    return parser.parse_args()
@@ -1,10 +1,18 @@
-import pandas as pd
 import random
+
+import pandas as pd
 from faker import Faker
 from datetime import datetime, timedelta
 from pathlib import Path
 
-fake = Faker()
+try:  # run directly (python gen_*.py) or as a module
+    from _gen_output import parse_args, save_frame
+except ImportError:
+    from ._gen_output import parse_args, save_frame  # type: ignore
+
+# Only the providers this script calls
+fake = Faker(providers=["faker.providers.internet", "faker.providers.date_time"])
+fake.seed_instance(42)
 
 def generate_synthetic_alerts(
     start_dt: datetime,
@@ -35,9 +43,14 @@ def generate_synthetic_alerts(
     src_ips = [fake.ipv4_public() for _ in range(num_distinct_src_ips)]
     dst_ip = "192.168.1.109"  # fixed destination IP for simplicity
 
-    rows = []
+    # One preallocated list per column; pandas converts each column once
+    ts_col = [None] * total_alerts
+    alert_type_col = [None] * total_alerts
+    src_ip_col = [None] * total_alerts
+    details_col = [None] * total_alerts
+    model_name_col = [None] * total_alerts
 
-    for _ in range(total_alerts):
+    for k in range(total_alerts):
         ts = fake.date_time_between(start_date=start_dt, end_date=end_dt)
         alert_type = random.choice(alert_types)
         src_ip = random.choice(src_ips)
@@ -66,23 +79,28 @@ def generate_synthetic_alerts(
                 f"in {random.randint(1, 10)} s"
             )
 
-        rows.append(
-            {
-                "ts": ts,  # keep as datetime
-                "alert_type": alert_type,
-                "src_ip": src_ip,
-                "dst_ip": dst_ip,
-                "details": details,
-                "model_name": model_name,  # ← new column
-            }
-        )
-
-    return pd.DataFrame(rows)
+        ts_col[k] = ts  # keep as datetime
+        alert_type_col[k] = alert_type
+        src_ip_col[k] = src_ip
+        details_col[k] = details
+        model_name_col[k] = model_name  # ← new column
+
+    return pd.DataFrame(
+        {
+            "ts": ts_col,
+            "alert_type": alert_type_col,
+            "src_ip": src_ip_col,
+            "dst_ip": dst_ip,  # scalar, broadcast by pandas
+            "details": details_col,
+            "model_name": model_name_col,
+        }
+    )
 
 
 # ------------------------ Example usage ------------------------
 
 if __name__ == "__main__":
+    args = parse_args("Generate synthetic IDS alerts")
     end_dt = datetime.now()
     start_dt = end_dt - timedelta(hours=48)
 
@@ -102,7 +120,7 @@ if __name__ == "__main__":
     data_dir.mkdir(parents=True, exist_ok=True)
 
     csv_path = data_dir / "synthetic_alerts.csv"
-    synthetic_alerts_df.to_csv(csv_path, index=False)
+    out_path = save_frame(synthetic_alerts_df, csv_path, args.format)
 
-    print(f"Saved {len(synthetic_alerts_df)} alerts → {csv_path}")
+    print(f"Saved {len(synthetic_alerts_df)} alerts → {out_path}")
     print(synthetic_alerts_df.head())
@@ -1,10 +1,18 @@
+
+import numpy as np
 import pandas as pd
-import random
 from faker import Faker
 from datetime import datetime, timedelta
 from pathlib import Path
 
-fake = Faker()
+try:  # run directly (python gen_*.py) or as a module
+    from _gen_output import parse_args, save_frame
+except ImportError:
+    from ._gen_output import parse_args, save_frame  # type: ignore
+
+# Only the provider this script calls
+fake = Faker(providers=["faker.providers.internet"])
+fake.seed_instance(42)
 
 
 def generate_host_stats(
@@ -37,65 +45,63 @@ def generate_host_stats(
     """
     host_ips = [fake.ipv4_private() for _ in range(num_distinct_hosts)]
 
-    intervals = []
-    current_time = start_dt
-
-    while current_time < end_dt and len(intervals) < total_records:
-        interval_start = current_time
-        interval_end = interval_start + timedelta(minutes=interval_minutes)
-        current_time = interval_end
-
-        for host_ip in host_ips:
-            total_packets = random.randint(1, 500)
-            incoming_packets = random.randint(0, total_packets)
-            outgoing_packets = total_packets - incoming_packets
-            unique_src_ips = random.randint(1, 20)
-            unique_dst_ports = random.randint(0, 20)
-            total_packets_size = random.randint(100, 15_000)
-
-            intervals.append(
-                {
-                    "interval_start": interval_start,  # keep as datetime
-                    "interval_end": interval_end,
-                    "host_ip": host_ip,
-                    "total_packets": total_packets,
-                    "incoming_packets": incoming_packets,
-                    "outgoing_packets": outgoing_packets,
-                    "unique_src_ips": unique_src_ips,
-                    "unique_dst_ports": unique_dst_ports,
-                    "total_packets_size": total_packets_size,
-                }
-            )
-
-            if len(intervals) >= total_records:
-                break
-
-    return pd.DataFrame(intervals)
+    # One timestamp per interval, then one row per host per interval
+    starts = pd.date_range(
+        start_dt, end_dt, freq=f"{interval_minutes}min", inclusive="left"
+    )
+    n_rows = min(len(starts) * num_distinct_hosts, total_records)
+
+    interval_start = np.repeat(starts.values, num_distinct_hosts)[:n_rows]
+    interval_end = interval_start + np.timedelta64(interval_minutes, "m")
+    host_ip = np.tile(host_ips, len(starts))[:n_rows]
+
+    # Every metric fits in uint8 / uint16 – no need for pandas' int64 default
+    rng = np.random.default_rng()
+    total_packets = rng.integers(1, 501, size=n_rows, dtype=np.uint16)
+    incoming_packets = rng.integers(0, total_packets + 1, dtype=np.uint16)
+    outgoing_packets = total_packets - incoming_packets
+
+    return pd.DataFrame(
+        {
+            "interval_start": interval_start,  # keep as datetime
+            "interval_end": interval_end,
+            "host_ip": host_ip,
+            "total_packets": total_packets,
+            "incoming_packets": incoming_packets,
+            "outgoing_packets": outgoing_packets,
+            "unique_src_ips": rng.integers(1, 21, size=n_rows, dtype=np.uint8),
+            "unique_dst_ports": rng.integers(0, 21, size=n_rows, dtype=np.uint8),
+            "total_packets_size": rng.integers(100, 15_001, size=n_rows, dtype=np.uint16),
+        }
+    )
 
 
 # --------------------------- Example usage ---------------------------
 
-end_dt = datetime.now()
-start_dt = end_dt - timedelta(hours=24)
+if __name__ == "__main__":
+    args = parse_args("Generate synthetic per-host traffic statistics")
+
+    end_dt = datetime.now()
+    start_dt = end_dt - timedelta(hours=24)
 
-synthetic_host_stats_df = generate_host_stats(
-    start_dt=start_dt,
-    end_dt=end_dt,
-    interval_minutes=30,
-    num_distinct_hosts=5,
-    total_records=1_000,
-)
+    synthetic_host_stats_df = generate_host_stats(
+        start_dt=start_dt,
+        end_dt=end_dt,
+        interval_minutes=30,
+        num_distinct_hosts=5,
+        total_records=1_000,
+    )
 
-# --------------------------- Save to CSV -----------------------------
+    # --------------------------- Save ------------------------------------
 
-here = Path(__file__).resolve()
-proj_root = here.parent.parent  # step up one level; adjust if needed
+    here = Path(__file__).resolve()
+    proj_root = here.parent.parent  # step up one level; adjust if needed
 
-target_dir = proj_root / "data"
-target_dir.mkdir(parents=True, exist_ok=True)
+    target_dir = proj_root / "data"
+    target_dir.mkdir(parents=True, exist_ok=True)
 
-csv_path = target_dir / "synthetic_host_stats.csv"
-synthetic_host_stats_df.to_csv(csv_path, index=False)
+    csv_path = target_dir / "synthetic_host_stats.csv"
+    out_path = save_frame(synthetic_host_stats_df, csv_path, args.format)
 
-print(f"Saved {len(synthetic_host_stats_df)} rows to {csv_path}")
-print(synthetic_host_stats_df.head())
+    print(f"Saved {len(synthetic_host_stats_df)} rows to {out_path}")
+    print(synthetic_host_stats_df.head())
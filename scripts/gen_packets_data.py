@@ -15,33 +15,62 @@ Run directly:
     python gen_packets_data.py
 """
 
-import random
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
-fake = Faker()
+try:  # run directly (python gen_*.py) or as a module
+    from _gen_output import parse_args, save_frame
+except ImportError:
+    from ._gen_output import parse_args, save_frame  # type: ignore
+
+# Only the providers this script calls (domain_name needs company → person)
+fake = Faker(
+    providers=[
+        "faker.providers.internet",
+        "faker.providers.date_time",
+        "faker.providers.company",
+        "faker.providers.person",
+    ]
+)
+fake.seed_instance(42)
 
 
 HEX_DIGITS = "0123456789ABCDEF"
 URL_SCHEMES = ["http", "https"]
 PROTOCOLS = ["TCP", "UDP", "TLS", "HTTP", "HTTPS", "RDP"]
 TCP_FLAG_OPTS = ["0x0018", "0x0010", "0x0002", "0x0011"]
+DST_PORT_OPTS = [80, 443, 8080]  # plus one random high port per row
+URL_POOL_SIZE = 1_000  # distinct domains / paths drawn from Faker per call
+
+_HEX_CODES = np.frombuffer(HEX_DIGITS.encode(), dtype=np.uint8)
+_rng = np.random.default_rng()
+
 
+def _random_hex(n_rows: int, len_bytes: int = 32) -> np.ndarray:
+    """Return *n_rows* strings of `len_bytes` hex digits (simulated raw payload)."""
+    codes = _HEX_CODES[_rng.integers(0, len(_HEX_CODES), size=(n_rows, len_bytes))]
+    # Reinterpret each row of ASCII codes as one fixed-width byte string
+    return codes.view(f"S{len_bytes}").ravel().astype(str)
 
-def _random_hex(len_bytes: int = 32) -> str:
-    """Return `len_bytes` * 2‑char hex digits (simulated raw payload)."""
-    return "".join(random.choices(HEX_DIGITS, k=len_bytes))
 
+def _bulk_urls(n_rows: int) -> np.ndarray:
+    """Return *n_rows* plausible random HTTP/S URLs.
+
+    Faker is called only to build small domain / path pools; rows then
+    sample from those pools by index.
+    """
+    pool_size = max(1, min(n_rows, URL_POOL_SIZE))
+    domains = np.array([fake.domain_name() for _ in range(pool_size)])
+    paths = np.array([fake.uri_path() for _ in range(pool_size)])  # no leading '/'
 
-def _random_url() -> str:
-    """Return a plausible random HTTP/S URL."""
-    scheme = random.choice(URL_SCHEMES)
-    domain = fake.domain_name()
-    path = fake.uri_path()  # already starts without '/'
-    return f"{scheme}://{domain}/{path}"
+    schemes = np.array(URL_SCHEMES)[_rng.integers(0, len(URL_SCHEMES), size=n_rows)]
+    hosts = domains[_rng.integers(0, pool_size, size=n_rows)]
+    tails = paths[_rng.integers(0, pool_size, size=n_rows)]
+    return np.char.add(np.char.add(np.char.add(schemes, "://"), hosts), np.char.add("/", tails))
 
 
 def generate_synthetic_packets(
@@ -67,40 +96,49 @@ def generate_synthetic_packets(
         Columns: ts, src_ip, src_port, dst_ip, dst_port, protocol,
                  pkt_len, tcp_flags, raw_data, full_url
     """
-    ip_pool = [fake.ipv4_public() for _ in range(num_distinct_ips)]
-
-    rows = []
-    for _ in range(total_packets):
-        ts = fake.date_time_between(start_date=start_dt, end_date=end_dt)
-        src_ip = random.choice(ip_pool)
-        dst_ip = random.choice([ip for ip in ip_pool if ip != src_ip])
-
-        protocol = random.choice(PROTOCOLS)
-        src_port = random.randint(1024, 65535)
-        dst_port = random.choice([80, 443, 8080, random.randint(1024, 65535)])
-        pkt_len = random.randint(40, 1500)
-        tcp_flags = random.choice(TCP_FLAG_OPTS)
-
-        # New fields
-        raw_data = _random_hex(32)
-        full_url = _random_url() if protocol in {"HTTP", "HTTPS"} else ""
-
-        rows.append(
-            {
-                "ts": ts,  # datetime; pandas handles serialisation
-                "src_ip": src_ip,
-                "src_port": src_port,
-                "dst_ip": dst_ip,
-                "dst_port": dst_port,
-                "protocol": protocol,
-                "pkt_len": pkt_len,
-                "tcp_flags": tcp_flags,
-                "raw_data": raw_data,
-                "full_url": full_url,
-            }
-        )
-
-    return pd.DataFrame(rows)
+    ip_pool = np.array([fake.ipv4_public() for _ in range(num_distinct_ips)])
+    n = total_packets
+
+    # Timestamps: uniform offsets (µs) inside the window
+    span_us = int((end_dt - start_dt) / timedelta(microseconds=1))
+    ts = np.datetime64(start_dt, "us") + _rng.integers(0, span_us, size=n).astype(
+        "timedelta64[us]"
+    )
+
+    # Distinct src/dst: shift the source index by 1..pool-1 (mod pool)
+    src_idx = _rng.integers(0, num_distinct_ips, size=n)
+    dst_idx = (src_idx + _rng.integers(1, num_distinct_ips, size=n)) % num_distinct_ips
+
+    proto_idx = _rng.integers(0, len(PROTOCOLS), size=n)
+    protocol = np.array(PROTOCOLS)[proto_idx]
+
+    # dst_port: one of the well-known ports or a random high port
+    dst_port = np.empty(n, dtype=np.int64)
+    dst_choice = _rng.integers(0, len(DST_PORT_OPTS) + 1, size=n)
+    is_fixed = dst_choice < len(DST_PORT_OPTS)
+    dst_port[is_fixed] = np.array(DST_PORT_OPTS)[dst_choice[is_fixed]]
+    dst_port[~is_fixed] = _rng.integers(1024, 65536, size=int((~is_fixed).sum()))
+
+    # New fields
+    raw_data = _random_hex(n, 32)
+    is_http = (proto_idx == PROTOCOLS.index("HTTP")) | (proto_idx == PROTOCOLS.index("HTTPS"))
+    full_url = np.full(n, "", dtype=object)
+    full_url[is_http] = _bulk_urls(int(is_http.sum()))
+
+    return pd.DataFrame(
+        {
+            "ts": ts,  # datetime64; pandas handles serialisation
+            "src_ip": ip_pool[src_idx],
+            "src_port": _rng.integers(1024, 65536, size=n),
+            "dst_ip": ip_pool[dst_idx],
+            "dst_port": dst_port,
+            "protocol": protocol,
+            "pkt_len": _rng.integers(40, 1501, size=n),
+            "tcp_flags": np.array(TCP_FLAG_OPTS)[_rng.integers(0, len(TCP_FLAG_OPTS), size=n)],
+            "raw_data": raw_data,
+            "full_url": full_url,
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -108,6 +146,8 @@ def generate_synthetic_packets(
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    args = parse_args("Generate synthetic packet records")
+
     # 24‑hour synthetic capture window
     end_dt = datetime.now()
     start_dt = end_dt - timedelta(hours=24)
@@ -125,7 +165,7 @@ if __name__ == "__main__":
     data_dir.mkdir(parents=True, exist_ok=True)
 
     csv_path = data_dir / "synthetic_packets.csv"
-    df.to_csv(csv_path, index=False)
+    out_path = save_frame(df, csv_path, args.format)
 
-    print(f"Saved {len(df)} packets → {csv_path}")
+    print(f"Saved {len(df)} packets → {out_path}")
     print(df.head())
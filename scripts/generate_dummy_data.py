@@ -39,21 +39,30 @@ np.random.seed(RNG_SEED)
 # Data generation
 # --------------------------------------------------------------------
 
+packet_rate       = np.random.normal(loc=100, scale=20, size=NUM_SAMPLES)   # packets/sec
+unique_port_count = np.random.normal(loc=10,  scale=3,  size=NUM_SAMPLES)   # distinct ports
+avg_pkt_size      = np.random.normal(loc=500, scale=50, size=NUM_SAMPLES)   # bytes
+
+# Clamp to sensible minimums (in place, before building the DataFrame)
+np.maximum(packet_rate,       0,  out=packet_rate)
+np.maximum(unique_port_count, 1,  out=unique_port_count)
+np.maximum(avg_pkt_size,      64, out=avg_pkt_size)  # min Ethernet frame size
+
+# float32 is ample precision for these metrics and halves the column size
+packet_rate       = packet_rate.astype(np.float32)
+unique_port_count = unique_port_count.astype(np.float32)
+avg_pkt_size      = avg_pkt_size.astype(np.float32)
+
 data = {
     "src_ip": [f"192.168.0.{i % 255}" for i in range(NUM_SAMPLES)],
-    "packet_rate":       np.random.normal(loc=100, scale=20, size=NUM_SAMPLES),   # packets/sec
-    "unique_port_count": np.random.normal(loc=10,  scale=3,  size=NUM_SAMPLES),   # distinct ports
-    "avg_pkt_size":      np.random.normal(loc=500, scale=50, size=NUM_SAMPLES),   # bytes
-    "generated_at":      [datetime.now()] * NUM_SAMPLES,                          # provenance
+    "packet_rate":       packet_rate,
+    "unique_port_count": unique_port_count,
+    "avg_pkt_size":      avg_pkt_size,
+    "generated_at":      np.full(NUM_SAMPLES, np.datetime64(datetime.now())),     # provenance
 }
 
 df = pd.DataFrame(data)
 
-# Clamp to sensible minimums
-df["packet_rate"]       = df["packet_rate"].clip(lower=0)
-df["unique_port_count"] = df["unique_port_count"].clip(lower=1)
-df["avg_pkt_size"]      = df["avg_pkt_size"].clip(lower=64)  # min Ethernet frame size
-
 # --------------------------------------------------------------------
 # Save to CSV (dynamic path)
 # --------------------------------------------------------------------
@@ -31,6 +31,11 @@ def _get_db_path() -> Path:
     return raw if raw.is_absolute() else BASE_DIR / raw
 
 
+def _quote_ident(name: str) -> str:
+    """Return *name* as a double-quoted SQLite identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 def _list_tables(conn: sqlite3.Connection) -> list[str]:
     """Return user tables (exclude internal *sqlite_%*)."""
     sql = """
@@ -46,7 +51,8 @@ def _describe_table(conn: sqlite3.Connection, table: str) -> None:
     print(f"\n=== Table: {table} ===")
 
     # Column metadata ---------------------------------------------------
-    info = conn.execute(f"PRAGMA table_info({table});").fetchall()
+    tbl = _quote_ident(table)
+    info = conn.execute(f"PRAGMA table_info({tbl});").fetchall()
     if not info:
         print("(No columns found)")
         return
@@ -61,9 +67,9 @@ def _describe_table(conn: sqlite3.Connection, table: str) -> None:
 
     # Sample rows -------------------------------------------------------
     print("\nSample rows:")
-    cols = ", ".join([i[1] for i in info])
-    sample_sql = f"SELECT {cols} FROM {table} LIMIT {args.rows};"
-    rows = conn.execute(sample_sql).fetchall()
+    cols = ", ".join(_quote_ident(i[1]) for i in info)
+    sample_sql = f"SELECT {cols} FROM {tbl} LIMIT ?;"
+    rows = conn.execute(sample_sql, (args.rows,)).fetchmany(args.rows)
     if rows:
         # Pretty‑print rows
         for row in rows:
@@ -90,8 +96,15 @@ def main() -> None:  # noqa: D401
     if not db_path.exists():
         raise SystemExit(f"Database file not found: {db_path}")
 
-    with sqlite3.connect(db_path) as conn:
+    # Read-only URI connection: no write locks, and mmap for table scans
+    with sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True) as conn:
         conn.row_factory = sqlite3.Row
+        conn.executescript(
+            "PRAGMA query_only = 1;"
+            "PRAGMA temp_store = MEMORY;"
+            "PRAGMA mmap_size = 268435456;"
+            "PRAGMA cache_size = -200000;"
+        )
         tables = _list_tables(conn)
         if not tables:
             print("No user tables found in database.")
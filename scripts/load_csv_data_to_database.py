@@ -1,6 +1,8 @@
+import csv
 import os
 import logging
 import psycopg2
+from psycopg2.extras import execute_batch
 import pandas as pd
 import config
 # -----------------------------------------------------------------------------
@@ -14,6 +16,12 @@ TABLE_NAME = "alerts"                  # Table into which we'll load data
 # Make sure these match exactly with the columns in your CSV headers.
 EXPECTED_COLUMNS = ["ts","alert_type","src_ip","dst_ip","details"]
 
+# INSERT statement built once at import rather than per CSV file
+INSERT_QUERY = (
+    f"INSERT INTO {TABLE_NAME} ({', '.join(EXPECTED_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(EXPECTED_COLUMNS))});"
+)
+
 # Database connection parameters (update for your environment)
 
 
@@ -64,54 +72,52 @@ def main():
     cursor = conn.cursor()
 
     # Loop over all files in the target directory
-    for filename in os.listdir(TARGET_DIRECTORY):
-        file_path = os.path.join(TARGET_DIRECTORY, filename)
+    for entry in os.scandir(TARGET_DIRECTORY):
+        file_path = entry.path
 
         # Only process if it's a CSV file
-        if filename.lower().endswith(".csv"):
+        if entry.name.lower().endswith(".csv"):
             logging.info(f"Processing file: {file_path}")
 
-            # Read the CSV file into a DataFrame
+            # Peek at the header line only, so mismatched files are skipped
+            # without parsing them into a DataFrame
             try:
-                df = pd.read_csv(file_path)
-            except Exception as e:
-                logging.error(f"Failed to read {file_path} as CSV: {e}")
+                with open(file_path, newline="") as fh:
+                    file_columns = next(csv.reader(fh), [])
+            except (OSError, csv.Error) as e:
+                logging.error(f"Failed to read header of {file_path}: {e}")
                 continue  # Skip this file
 
             # Check if the columns match what we expect
-            file_columns = list(df.columns)
             if file_columns == EXPECTED_COLUMNS:
                 logging.info(f"Header matches expected columns. Preparing to load data into '{TABLE_NAME}'.")
-                
-                # Load rows into the table
-                rows_loaded = 0
-                for _, row in df.iterrows():
-                    # Build INSERT query. If your columns are different types,
-                    # or you have more columns, adjust accordingly.
-                    insert_query = f"""
-                        INSERT INTO {TABLE_NAME} 
-                        (ts,alert_type,src_ip,dst_ip,details)
-                        VALUES (%s, %s, %s, %s, %s);
-                    """
-                    row_data = (
-                        row["ts"],
-                        row["alert_type"],
-                        row["src_ip"],
-                        row["dst_ip"],
-                        row["details"]
+
+                # Read the CSV file into a DataFrame
+                try:
+                    df = pd.read_csv(
+                        file_path,
+                        usecols=EXPECTED_COLUMNS,
+                        dtype={"alert_type": "category"},
                     )
-                    try:
-                        cursor.execute(insert_query, row_data)
-                        rows_loaded += 1
-                    except Exception as e:
-                        logging.error(f"Error inserting row '{row_data}': {e}")
-                        conn.rollback()  # Roll back this transaction portion
-                        break  # Move to the next file or handle error further
-                
-                # If we didn’t break early, commit the changes
-                else:
+                except Exception as e:
+                    logging.error(f"Failed to read {file_path} as CSV: {e}")
+                    continue  # Skip this file
+
+                # Column-major extraction: NaN → None, then zip the object
+                # arrays into row tuples without per-row Series boxing
+                df = df[EXPECTED_COLUMNS]
+                df = df.astype(object).where(df.notna(), None)
+                rows = list(zip(*(df[col].to_numpy(dtype=object) for col in EXPECTED_COLUMNS)))
+
+                # Ship every row in one batched transaction; a failure
+                # rolls back the whole file.
+                try:
+                    execute_batch(cursor, INSERT_QUERY, rows, page_size=1000)
                     conn.commit()
-                    logging.info(f"Loaded {rows_loaded} rows from '{file_path}' into '{TABLE_NAME}'.")
+                    logging.info(f"Loaded {len(rows)} rows from '{file_path}' into '{TABLE_NAME}'.")
+                except Exception as e:
+                    logging.error(f"Error loading '{file_path}' into '{TABLE_NAME}': {e}")
+                    conn.rollback()  # Discard the partial batch for this file
             else:
                 logging.warning(f"File '{file_path}' header does not match expected columns. Skipping load.")
         else:
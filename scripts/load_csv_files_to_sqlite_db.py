@@ -9,12 +9,16 @@ change it in **config.py** without touching this script.
 """
 from __future__ import annotations
 
+import csv
 import logging
+import logging.handlers
+import queue
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Iterator
 
-import pandas as pd
 from ids.core import config  # BASE_DIR & sqlite_config live here
 
 # ---------------------------------------------------------------------------
@@ -27,14 +31,25 @@ LOG_DIR: Path = BASE_DIR / "log"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE: Path = LOG_DIR / "csv_data_loader_sqlite.log"
 
-logging.basicConfig(
-    filename=str(LOG_FILE),
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+MAX_WORKERS: int = 8  # CSV parser threads; inserts stay on a single writer
+BATCH_ROWS: int = 5_000  # rows per batch handed from a parser to the writer
+QUEUE_BATCHES: int = 4  # batches a parser may run ahead of the writer
+
+LOG_FORMAT = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+# File output is buffered and written every 1000 records (or on ERROR)
+file_handler = logging.FileHandler(str(LOG_FILE))
+file_handler.setFormatter(LOG_FORMAT)
+FILE_BUFFER = logging.handlers.MemoryHandler(
+    1000, flushLevel=logging.ERROR, target=file_handler
 )
 console = logging.StreamHandler()
-console.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-logging.getLogger().addHandler(console)
+console.setFormatter(LOG_FORMAT)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(FILE_BUFFER)
+root_logger.addHandler(console)
 
 # ---------------------------------------------------------------------------
 # Table → columns mapping (must exactly match CSV headers)
@@ -79,15 +94,84 @@ TABLE_CONFIGS: dict[str, list[str]] = {
     ],
 }
 
+# Reverse lookup: CSV header → target table
+HEADER_TO_TABLE: dict[tuple[str, ...], str] = {
+    tuple(columns): table for table, columns in TABLE_CONFIGS.items()
+}
+
+# Parameterised INSERT per table, built once at import
+INSERT_SQL: dict[str, str] = {
+    table: (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['?'] * len(columns))});"
+    )
+    for table, columns in TABLE_CONFIGS.items()
+}
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _clean(value: Any) -> Any:  # noqa: D401 – imperative mood
-    """Convert pandas NaN/NaT to ``None`` so SQLite stores NULL."""
-    if pd.isna(value):
+def _iter_rows(reader: Iterator[list[str]]) -> Iterator[tuple[str | None, ...]]:
+    """Yield CSV records as tuples, mapping empty fields to ``None`` (NULL)."""
+    for record in reader:
+        yield tuple(value if value != "" else None for value in record)
+
+
+def _parse_file(csv_file: Path, batches: queue.Queue) -> None:
+    """Put ``(table, rows)`` batches of *csv_file* on *batches*, then ``None``.
+
+    Any read error (I/O, CSV syntax, bad UTF-8, …) is put on the queue before
+    the ``None`` so the writer re-raises it and rolls the file back. The queue is bounded, so memory stays at a few
+    batches per file however large it is.
+    """
+    logging.info("Reading %s", csv_file.name)
+    try:
+        with csv_file.open(newline="", encoding="utf-8") as fh:
+            reader = csv.reader(fh)
+            header = next(reader, [])
+            table = HEADER_TO_TABLE.get(tuple(header))
+            if table is None:
+                logging.warning("Header of %s does not match any table; skipping", csv_file.name)
+                return
+            rows = _iter_rows(reader)
+            while batch := list(islice(rows, BATCH_ROWS)):
+                batches.put((table, batch))
+    except Exception as exc:
+        batches.put(exc)
+    finally:
+        batches.put(None)
+
+
+def _write_file(conn: sqlite3.Connection, csv_file: Path, batches: queue.Queue) -> int | None:
+    """Insert the batches of *csv_file* in one transaction; return the row count.
+
+    Returns ``None`` if the file was skipped or failed. The queue is always
+    drained to its end marker so the parser thread never blocks.
+    """
+    table, row_count = None, 0
+    try:
+        # One transaction per file: committed on success, rolled back on error
+        with conn:
+            while (item := batches.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                table, batch = item
+                conn.executemany(INSERT_SQL[table], batch)
+                row_count += len(batch)
+    except sqlite3.Error as exc:
+        logging.error("Insertion failed for %s → %s: %s", csv_file.name, table, exc)
+        while batches.get() is not None:
+            pass
+        return None
+    except Exception as exc:  # raised by the parser thread, see _parse_file
+        logging.error("Could not read %s: %s", csv_file.name, exc)
+        return None
+
+    if table is None:  # skipped or empty
         return None
-    return value
+    logging.info("Inserted %d rows into '%s' from %s", row_count, table, csv_file.name)
+    return row_count
 
 
 def _get_db_path() -> Path:
@@ -109,46 +193,42 @@ def main() -> None:  # noqa: D401
     try:
         conn = sqlite3.connect(db_path)
         conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
         logging.info("Connected to SQLite DB at %s", db_path)
     except sqlite3.Error as exc:
         logging.error("Failed to connect to SQLite: %s", exc)
         return
 
-    cur = conn.cursor()
-
-    for csv_file in CSV_DIR.glob("*.csv"):
-        logging.info("Reading %s", csv_file.name)
-        try:
-            df = pd.read_csv(csv_file)
-        except Exception as exc:  # noqa: BLE001 – continue other files
-            logging.error("Could not read %s: %s", csv_file.name, exc)
-            continue
-
-        header = list(df.columns)
-
-        for table, expected in TABLE_CONFIGS.items():
-            if header == expected:
-                placeholders = ", ".join(["?"] * len(expected))
-                columns = ", ".join(expected)
-                sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders});"
-
-                row_count = 0
-                try:
-                    for _, row in df.iterrows():
-                        cur.execute(sql, tuple(_clean(row[col]) for col in expected))
-                        row_count += 1
-                    conn.commit()
-                    logging.info("Inserted %d rows into '%s' from %s", row_count, table, csv_file.name)
-                except Exception as exc:
-                    logging.error("Insertion failed for %s → %s: %s", csv_file.name, table, exc)
-                    conn.rollback()
-                break  # header matched, no need to test other tables
-        else:
-            logging.warning("Header of %s does not match any table; skipping", csv_file.name)
-
-    cur.close()
+    files = sorted(CSV_DIR.glob("*.csv"))
+    total_rows = 0
+    loaded_files = 0
+
+    # Parser threads feed bounded per-file queues; SQLite serialises writes, so
+    # one writer drains them in file order. Pool tasks start in submission
+    # order, so the file being written always has a running parser.
+    queues = [queue.Queue(maxsize=QUEUE_BATCHES) for _ in files]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(files) or 1)) as pool:
+        parsers = [
+            pool.submit(_parse_file, csv_file, batches)
+            for csv_file, batches in zip(files, queues)
+        ]
+        for csv_file, batches, parser in zip(files, queues, parsers):
+            row_count = _write_file(conn, csv_file, batches)
+            try:
+                parser.result()  # done: its end marker has been consumed
+            except Exception:
+                logging.exception("Parser for %s crashed", csv_file.name)
+                continue
+            if row_count is not None:
+                total_rows += row_count
+                loaded_files += 1
+
+    logging.info("Loaded %d rows from %d/%d files", total_rows, loaded_files, len(files))
     conn.close()
     logging.info("CSV loader finished.")
+    FILE_BUFFER.flush()
 
 
 if __name__ == "__main__":
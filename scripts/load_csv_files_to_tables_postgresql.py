@@ -2,17 +2,36 @@
 load_csv_files_to_db_tables.py
 ------------------------------
 Scans the gen_data/data directory, loads each CSV that matches one of the
-known schemas, and inserts the rows into the corresponding PostgreSQL table.
+known schemas, and streams the rows into the corresponding PostgreSQL table
+with binary ``COPY ... FROM STDIN`` (one transaction per file). Fields are
+cast to Python types client-side via ``TABLE_TYPES`` so the server skips
+text parsing. When ``pyarrow`` and ``adbc-driver-postgresql`` are installed,
+files are instead parsed multi-threaded by Arrow and ingested via ADBC.
+Files are loaded concurrently over a shared connection pool.
 All paths are built dynamically from config.BASE_DIR, and the database
 connection uses the DSN stored in config.DB_DSN.
 """
 
+import csv
+import ipaddress
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-import psycopg2
-import pandas as pd
+from typing import Any, Callable
+import psycopg
+from psycopg_pool import ConnectionPool
 from ids.core import config   # ← provides BASE_DIR and DB_DSN
 
+try:  # optional Arrow-native fast path
+    import adbc_driver_postgresql.dbapi as adbc_pg
+    import pyarrow.csv as pa_csv
+except ModuleNotFoundError:  # pragma: no cover – libraries not installed
+    adbc_pg = None  # type: ignore[assignment]
+    pa_csv = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Dynamic paths
 # ---------------------------------------------------------------------------
@@ -24,6 +43,8 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 LOG_FILE = LOG_DIR / "csv_data_loader.log"
 
+MAX_WORKERS = 8   # upper bound on concurrent COPY connections
+
 # ---------------------------------------------------------------------------
 # Table → column mapping
 # ---------------------------------------------------------------------------
@@ -58,84 +79,177 @@ TABLE_CONFIGS = {
     ],
 }
 
+# Per-column (Postgres type, CSV text → Python caster); order follows TABLE_CONFIGS
+_TS = ("timestamp", datetime.fromisoformat)
+_INET = ("inet", ipaddress.ip_address)
+_INT = ("int4", int)
+_TEXT = ("text", str)
+
+TABLE_TYPES: dict[str, list[tuple[str, Callable[[str], Any]]]] = {
+    "alerts": [_TS, _TEXT, _INET, _INET, _TEXT],
+    "host_stats": [_TS, _TS, _INET, _INT, _INT, _INT, _INT, _INT, _INT],
+    "packets": [_TS, _INET, _INT, _INET, _INT, _TEXT, _INT, _TEXT],
+}
+
+# Reverse lookup: CSV header → target table
+HEADER_TO_TABLE = {tuple(cols): name for name, cols in TABLE_CONFIGS.items()}
+
+# COPY statement per table, built once at import
+COPY_SQL = {
+    name: f"COPY {name} ({', '.join(cols)}) FROM STDIN (FORMAT BINARY)"
+    for name, cols in TABLE_CONFIGS.items()
+}
+
+# Bulk loads are simply re-run on a crash, so skip the per-commit WAL fsync
+SYNC_COMMIT_OFF_SQL = "SET LOCAL synchronous_commit = off"
+
+# ADBC path: temp staging table per table, then a typed INSERT … SELECT
+STAGING_TABLE = {name: f"_stage_{name}" for name in TABLE_CONFIGS}
+INSERT_FROM_STAGING_SQL = {
+    name: (
+        f"INSERT INTO {name} ({', '.join(cols)}) "
+        f"SELECT {', '.join(f'{col}::{pg_type}' for col, (pg_type, _) in zip(cols, TABLE_TYPES[name]))} "
+        f"FROM {STAGING_TABLE[name]}"
+    )
+    for name, cols in TABLE_CONFIGS.items()
+}
+
 # ---------------------------------------------------------------------------
 # Logging setup
 # ---------------------------------------------------------------------------
-logging.basicConfig(
-    filename=str(LOG_FILE),
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+# File output is buffered and written every 1000 records (or on ERROR)
+file_handler = logging.FileHandler(str(LOG_FILE))
+file_handler.setFormatter(log_formatter)
+FILE_BUFFER = logging.handlers.MemoryHandler(
+    1000, flushLevel=logging.ERROR, target=file_handler
 )
 
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
-console_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-console_handler.setFormatter(console_formatter)
+console_handler.setFormatter(log_formatter)
+
+logging.getLogger("").setLevel(logging.INFO)
+logging.getLogger("").addHandler(FILE_BUFFER)
 logging.getLogger("").addHandler(console_handler)
 
+# ---------------------------------------------------------------------------
+# Per-file loaders
+# ---------------------------------------------------------------------------
+_LOAD_ERRORS: tuple[type[BaseException], ...] = (OSError, csv.Error, ValueError, psycopg.Error)
+if adbc_pg is not None:
+    _LOAD_ERRORS += (adbc_pg.Error,)
+
+
+def _copy_rows(db_pool: ConnectionPool, file_path: Path, table_name: str) -> int:
+    """Stream CSV records into *table_name* with psycopg binary COPY."""
+    pg_types = [pg_type for pg_type, _ in TABLE_TYPES[table_name]]
+    casters = [cast for _, cast in TABLE_TYPES[table_name]]
+    row_count = 0
+
+    with open(file_path, newline="") as fh:
+        reader = csv.reader(fh)
+        next(reader, None)  # header already matched
+
+        # The pooled connection block commits on success, rolls back on error
+        with db_pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(SYNC_COMMIT_OFF_SQL)
+            with cursor.copy(COPY_SQL[table_name]) as copy:
+                copy.set_types(pg_types)
+                for record in reader:
+                    copy.write_row(
+                        [cast(value) if value != "" else None
+                         for cast, value in zip(casters, record)]
+                    )
+                    row_count += 1
+    return row_count
+
+
+def _ingest_arrow(file_path: Path, table_name: str) -> int:
+    """Parse with pyarrow and bulk-ingest the Arrow table through ADBC.
+
+    ADBC's binary COPY cannot coerce strings to ``inet``, so the table lands
+    in a session-temporary staging table first and is cast on the way in.
+    """
+    arrow_table = pa_csv.read_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+    )
+    if arrow_table.column_names != TABLE_CONFIGS[table_name]:
+        raise ValueError(f"unexpected columns {arrow_table.column_names}")
+
+    with adbc_pg.connect(config.DB_DSN) as conn, conn.cursor() as cursor:
+        cursor.execute(SYNC_COMMIT_OFF_SQL)
+        cursor.adbc_ingest(STAGING_TABLE[table_name], arrow_table, mode="create", temporary=True)
+        cursor.execute(INSERT_FROM_STAGING_SQL[table_name])
+        row_count = cursor.rowcount
+        conn.commit()
+    return row_count
+
+
+def _load_one(db_pool: ConnectionPool, file_path: Path) -> int:
+    """Load a single CSV into its matching table and return the row count.
+
+    Uses the pyarrow/ADBC path when those packages are installed, otherwise
+    psycopg binary COPY on a connection borrowed from *db_pool*.
+    """
+    logging.info(f"Processing file: {file_path}")
+
+    try:
+        with open(file_path, newline="") as fh:
+            file_columns = next(csv.reader(fh), [])
+    except (OSError, csv.Error) as exc:
+        logging.error(f"Failed to read '{file_path}': {exc}")
+        return 0
+
+    # Match file header to a known table schema
+    table_name = HEADER_TO_TABLE.get(tuple(file_columns))
+    if table_name is None:
+        logging.warning(
+            f"File '{file_path.name}' header does not match any expected schema. Skipping."
+        )
+        return 0
+
+    logging.info(f"Header of '{file_path.name}' matches table '{table_name}'. Loading rows...")
+
+    try:
+        if adbc_pg is not None:
+            row_count = _ingest_arrow(file_path, table_name)
+        else:
+            row_count = _copy_rows(db_pool, file_path, table_name)
+    except _LOAD_ERRORS as exc:
+        logging.error(f"Loading '{file_path.name}' failed: {exc}")
+        return 0
+
+    logging.info(f"Loaded {row_count} rows from '{file_path.name}' into '{table_name}'.")
+    return row_count
+
+
 # ---------------------------------------------------------------------------
 # Main loader
 # ---------------------------------------------------------------------------
 def main() -> None:
     logging.info(f"Starting data-load process. Directory: '{TARGET_DIRECTORY}'")
 
-    # --- Connect using DSN ---------------------------------------------------
-    try:
-        conn = psycopg2.connect(config.DB_DSN)
-        logging.info("Successfully connected to PostgreSQL via DSN.")
-    except psycopg2.Error as exc:
-        logging.error(f"Database connection failed: {exc}")
+    files = sorted(TARGET_DIRECTORY.glob("*.csv"))
+    if not files:
+        logging.info("No CSV files found. Nothing to load.")
         return
 
-    cursor = conn.cursor()
-
-    # --- Iterate over *.csv files -------------------------------------------
-    for file_path in TARGET_DIRECTORY.glob("*.csv"):
-        logging.info(f"Processing file: {file_path}")
-
-        try:
-            df = pd.read_csv(file_path)
-        except Exception as exc:
-            logging.error(f"Failed to read '{file_path}': {exc}")
-            continue
-
-        file_columns = list(df.columns)
-
-        # Match file header to a known table schema
-        for table_name, expected_columns in TABLE_CONFIGS.items():
-            if file_columns == expected_columns:
-                logging.info(
-                    f"Header matches table '{table_name}'. Loading rows..."
-                )
-
-                placeholders = ", ".join(["%s"] * len(expected_columns))
-                columns = ", ".join(expected_columns)
-                insert_sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders});"
-
-                rows_loaded = 0
-                for _, row in df.iterrows():
-                    row_data = tuple(row[col] for col in expected_columns)
-                    try:
-                        cursor.execute(insert_sql, row_data)
-                        rows_loaded += 1
-                    except Exception as exc:
-                        logging.error(f"Error inserting row {row_data}: {exc}")
-                        conn.rollback()
-                        break  # stop processing this file
-                else:
-                    conn.commit()
-                    logging.info(
-                        f"Loaded {rows_loaded} rows from '{file_path.name}' into '{table_name}'."
-                    )
-                break  # stop checking other table schemas
-        else:
-            logging.warning(
-                f"File '{file_path.name}' header does not match any expected schema. Skipping."
-            )
+    # Independent files load in parallel; workers share up to MAX_WORKERS
+    # pooled connections, opened on first use
+    workers = min(MAX_WORKERS, len(files))
+    with ConnectionPool(config.DB_DSN, min_size=0, max_size=workers, open=True) as db_pool, \
+            ThreadPoolExecutor(max_workers=workers) as executor:
+        row_counts = list(executor.map(partial(_load_one, db_pool), files))
 
-    cursor.close()
-    conn.close()
-    logging.info("Data-load process complete. Connection closed.")
+    loaded = sum(1 for count in row_counts if count)
+    logging.info(
+        f"Data-load process complete. {sum(row_counts)} rows from {loaded}/{len(files)} files."
+    )
+    FILE_BUFFER.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,146 @@
+"""
+load_csv_files_to_tables_postgresql_async.py
+--------------------------------------------
+asyncio counterpart to *load_csv_files_to_tables_postgresql.py*.
+
+Every CSV in the data directory whose header matches a known schema is
+streamed into its PostgreSQL table with asyncpg's native binary COPY
+(``copy_records_to_table``). All files load concurrently over a shared
+connection pool; each file is its own transaction.
+Table schemas, paths and logging are imported from the synchronous loader;
+the connection comes from config.DB_DSN. CSV parsing runs in worker threads
+so it never blocks the event loop.
+"""
+
+import asyncio
+import csv
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import asyncpg
+from psycopg.conninfo import conninfo_to_dict
+from ids.core import config   # ← provides DB_DSN
+
+# Schema, paths and logging are shared with the synchronous loader
+from ids.scripts.load_csv_files_to_tables_postgresql import (
+    FILE_BUFFER,
+    HEADER_TO_TABLE,
+    SYNC_COMMIT_OFF_SQL,
+    TABLE_CONFIGS,
+    TABLE_TYPES,
+    TARGET_DIRECTORY,
+)
+
+POOL_MIN_SIZE = 4
+POOL_MAX_SIZE = 16
+BATCH_ROWS = 5_000  # CSV rows parsed per worker-thread call
+
+# CSV text → Python value per column; asyncpg encodes these in binary
+TABLE_CASTERS: dict[str, list[Callable[[str], Any]]] = {
+    name: [cast for _, cast in types] for name, types in TABLE_TYPES.items()
+}
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _pool_kwargs(dsn: str) -> dict[str, str]:
+    """Translate a libpq ``key=value`` DSN into asyncpg connect kwargs."""
+    params = conninfo_to_dict(dsn)
+    if "dbname" in params:
+        params["database"] = params.pop("dbname")
+    return params
+
+
+def _typed_rows(reader: Iterator[list[str]], casters: list[Callable[[str], Any]]) -> Iterator[tuple]:
+    """Yield CSV records cast per column; empty fields become NULL."""
+    for record in reader:
+        yield tuple(
+            cast(value) if value != "" else None
+            for cast, value in zip(casters, record)
+        )
+
+
+async def _aiter_batched(records: Iterator[tuple]) -> AsyncIterator[tuple]:
+    """Yield *records*, reading and casting BATCH_ROWS at a time in a thread.
+
+    CSV parsing is blocking; running it off the event loop lets the other
+    files' COPYs proceed meanwhile.
+    """
+    while batch := await asyncio.to_thread(list, islice(records, BATCH_ROWS)):
+        for record in batch:
+            yield record
+
+
+# ---------------------------------------------------------------------------
+# Per-file loader
+# ---------------------------------------------------------------------------
+async def _load_one(pool: asyncpg.Pool, file_path: Path) -> int:
+    """COPY a single CSV into its matching table and return the row count."""
+    logging.info(f"Processing file: {file_path}")
+
+    try:
+        with await asyncio.to_thread(open, file_path, newline="") as fh:
+            reader = csv.reader(fh)
+            file_columns = await asyncio.to_thread(next, reader, [])
+
+            # Match file header to a known table schema
+            table_name = HEADER_TO_TABLE.get(tuple(file_columns))
+            if table_name is None:
+                logging.warning(
+                    f"File '{file_path.name}' header does not match any expected schema. Skipping."
+                )
+                return 0
+
+            logging.info(f"Header of '{file_path.name}' matches table '{table_name}'. Loading rows...")
+
+            records = _aiter_batched(_typed_rows(reader, TABLE_CASTERS[table_name]))
+            async with pool.acquire() as conn, conn.transaction():
+                await conn.execute(SYNC_COMMIT_OFF_SQL)
+                status = await conn.copy_records_to_table(
+                    table_name, records=records, columns=TABLE_CONFIGS[table_name]
+                )
+    except (OSError, csv.Error, ValueError, asyncpg.PostgresError) as exc:
+        logging.error(f"Loading '{file_path.name}' failed: {exc}")
+        return 0
+
+    row_count = int(status.split()[-1])  # "COPY <n>"
+    logging.info(f"Loaded {row_count} rows from '{file_path.name}' into '{table_name}'.")
+    return row_count
+
+
+# ---------------------------------------------------------------------------
+# Main loader
+# ---------------------------------------------------------------------------
+async def main() -> None:
+    logging.info(f"Starting async data-load process. Directory: '{TARGET_DIRECTORY}'")
+
+    files = sorted(TARGET_DIRECTORY.glob("*.csv"))
+    if not files:
+        logging.info("No CSV files found. Nothing to load.")
+        return
+
+    try:
+        pool = await asyncpg.create_pool(
+            min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE, **_pool_kwargs(config.DB_DSN)
+        )
+    except (OSError, asyncpg.PostgresError) as exc:
+        logging.error(f"Database connection failed: {exc}")
+        return
+
+    async with pool:
+        row_counts = await asyncio.gather(*(_load_one(pool, path) for path in files))
+
+    loaded = sum(1 for count in row_counts if count)
+    logging.info(
+        f"Data-load process complete. {sum(row_counts)} rows from {loaded}/{len(files)} files."
+    )
+    FILE_BUFFER.flush()
+
+
+# ---------------------------------------------------------------------------
+# Script entry point
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,6 +6,12 @@ signal handlers via :py:meth:`asyncio.loop.add_signal_handler`, which raises
 
 * Register SIGINT/SIGTERM handlers **only** on non‑Windows platforms.
 * Always rely on ``KeyboardInterrupt`` (Ctrl‑C) to stop gracefully.
+
+In the Postgres ("prod") environment, alerts are handed to a background
+asyncio loop that batches them into ``asyncpg`` ``executemany`` calls, so the
+sniffer never waits on a per-alert round-trip. A batch that fails is written
+again alert by alert through the synchronous ``db.insert_alert`` path; only
+alerts that fail there too are dropped, each one logged.
 """
 from __future__ import annotations
 
@@ -14,23 +20,143 @@ import asyncio
 import os
 import signal
 import sys
-from typing import Sequence
+import threading
+from typing import Any, Callable, Mapping, Sequence
 
 from ids.core import DetectorEngine, PacketSniffer, SynFloodDetector, config
+from ids.core.db import db
+
+try:
+    import asyncpg
+    from psycopg.conninfo import conninfo_to_dict
+except ModuleNotFoundError:  # pragma: no cover – library not installed
+    asyncpg = None  # type: ignore[assignment]
+
+ALERT_BATCH_SIZE = 500   # flush after this many alerts …
+ALERT_FLUSH_SEC = 0.1    # … or after this long, whichever comes first
+ALERT_COLUMNS = ("ts", "alert_type", "src_ip", "dst_ip", "details", "model_name")
+INSERT_ALERTS_SQL = (
+    f"INSERT INTO alerts ({', '.join(ALERT_COLUMNS)}) "
+    f"VALUES ({', '.join(f'${i}' for i in range(1, len(ALERT_COLUMNS) + 1))})"
+)
+
+# ---------------------------------------------------------------------------
+# Background alert writer
+# ---------------------------------------------------------------------------
+
+class _AlertWriter:
+    """asyncio loop on a daemon thread that batches alerts into Postgres."""
+
+    def __init__(self, dsn: str):
+        params = conninfo_to_dict(dsn)
+        if "dbname" in params:
+            params["database"] = params.pop("dbname")
+
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True, name="alert-writer").start()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        # Connect up front so a bad DSN fails here, not inside the task
+        try:
+            self._pool = self._call(self._open_pool(params))
+        except BaseException:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            raise
+        self._task = asyncio.run_coroutine_threadsafe(self._drain(), self._loop)
+
+    def _call(self, coro, timeout: float | None = 10.0):
+        """Run *coro* on the writer loop and block for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    @staticmethod
+    async def _open_pool(params: Mapping[str, str]):
+        # Built inside the writer loop so the pool binds to it
+        return await asyncpg.create_pool(min_size=1, max_size=4, **params)
+
+    def submit(self, alert: Mapping[str, Any]) -> None:
+        """Thread-safe: enqueue *alert* for the next batch."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, alert)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending alerts, close the pool and stop the loop."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+        try:
+            self._task.result(timeout)
+        finally:
+            self._call(self._pool.close(), timeout)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _next_batch(self) -> tuple[list[Mapping[str, Any]], bool]:
+        """Collect up to ALERT_BATCH_SIZE alerts or wait ALERT_FLUSH_SEC."""
+        batch: list[Mapping[str, Any]] = []
+        item = await self._queue.get()
+        deadline = self._loop.time() + ALERT_FLUSH_SEC
+        while item is not None:
+            batch.append(item)
+            remaining = deadline - self._loop.time()
+            if len(batch) >= ALERT_BATCH_SIZE or remaining <= 0:
+                return batch, False
+            try:
+                item = await asyncio.wait_for(self._queue.get(), remaining)
+            except asyncio.TimeoutError:
+                return batch, False
+        return batch, True  # sentinel seen: final batch
+
+    async def _drain(self) -> None:
+        done = False
+        while not done:
+            batch, done = await self._next_batch()
+            if not batch:
+                continue
+            # The drain task must survive any error, or every later alert would
+            # pile up in the queue unwritten. executemany is atomic, so after a
+            # failure none of the batch is in the table yet.
+            try:
+                rows = [tuple(alert[col] for col in ALERT_COLUMNS) for alert in batch]
+                await self._pool.executemany(INSERT_ALERTS_SQL, rows)
+            except Exception as exc:
+                print(f"[WARN] Batch of {len(batch)} alerts failed ({type(exc).__name__}: {exc}); "
+                      "writing them one by one.")
+                await asyncio.to_thread(self._insert_each, batch)
+
+    @staticmethod
+    def _insert_each(batch: list[Mapping[str, Any]]) -> None:
+        """Fallback: write *batch* through the synchronous DB path, per alert."""
+        for alert in batch:
+            try:
+                db.insert_alert(alert)
+            except Exception as exc:
+                print(f"[ERROR] Dropped alert {dict(alert)!r}: {type(exc).__name__}: {exc}")
+
 
 # ---------------------------------------------------------------------------
 # Helper factory
 # ---------------------------------------------------------------------------
 
-def _build_engine() -> DetectorEngine:
+def _build_engine(alert_sink: Callable[[Mapping[str, Any]], None] | None = None) -> DetectorEngine:
     """Return a DetectorEngine instance with configured detectors."""
-    return DetectorEngine(detectors=[SynFloodDetector()])
+    return DetectorEngine(detectors=[SynFloodDetector()], alert_sink=alert_sink)
+
+
+def _start_alert_writer() -> _AlertWriter | None:
+    """Return a batching alert writer, or ``None`` to use the direct DB path."""
+    if asyncpg is None or config.ENVIRONMENT != "prod":
+        return None
+    try:
+        return _AlertWriter(config.DB_DSN)
+    except (OSError, asyncpg.PostgresError) as exc:
+        print(f"[WARN] Async alert writer unavailable ({exc}); writing alerts directly.")
+        return None
 
 
 def _run(interface: str) -> None:
     """Synchronous wrapper to run the packet sniffer."""
-    sniffer = PacketSniffer(interface, _build_engine())
-    sniffer.run()
+    writer = _start_alert_writer()
+    sniffer = PacketSniffer(interface, _build_engine(writer.submit if writer else None))
+    try:
+        sniffer.run()
+    finally:
+        if writer:
+            writer.close()
 
 
 # ---------------------------------------------------------------------------
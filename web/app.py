@@ -10,14 +10,19 @@ Override at runtime with the IDS_ENV environment variable.
 """
 from __future__ import annotations
 
+import hashlib
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Mapping, Final
 
+from apscheduler.schedulers.background import BackgroundScheduler
 from flask import Flask, redirect, url_for
+from sqlalchemy import inspect
 
-from ids.web.extensions import db
+from ids.web.extensions import DiskUploadRequest, cache, db, engine_options
 from ids.web.routes import register_blueprints
+from ids.web.routes._training_shared import prune_pngs
 from ids.core import config as core_cfg  # re-use the central config
 
 # --------------------------------------------------------------------------- #
@@ -25,8 +30,12 @@ from ids.core import config as core_cfg  # re-use the central config
 # --------------------------------------------------------------------------- #
 
 
+@lru_cache(maxsize=2)
 def _build_db_uri(env: str) -> str:
-    """Return an SQLAlchemy-compatible DB-URI for *env* (“prod” / “test”)."""
+    """Return an SQLAlchemy-compatible DB-URI for *env* (“prod” / “test”).
+
+    Cached per process so repeated ``create_app()`` calls skip the rebuild.
+    """
     if env == "prod":
         cfg: Mapping[str, str] = core_cfg.postgres_config
         return (
@@ -42,6 +51,26 @@ def _build_db_uri(env: str) -> str:
     raise ValueError("ENVIRONMENT must be 'prod' or 'test'")
 
 
+# Old training plots are deleted in the background, never on a request
+PNG_GC_MINUTES = 5
+scheduler = BackgroundScheduler(daemon=True)
+
+
+def _gc_training_dirs(app: Flask) -> None:
+    """Keep only the newest plots in the pruned training-result folders."""
+    results = Path(app.root_path, "static", "training_results")
+    for directory in (results, results / "unsupervised"):
+        removed = prune_pngs(directory, logger=app.logger)
+        if removed:
+            app.logger.info("Removed %d old plot(s) from %s", removed, directory)
+
+
+def _bootstrap_sentinel(db_uri: str) -> Path:
+    """File marking that tables and the default admin exist in *db_uri*'s DB."""
+    digest = hashlib.sha256(db_uri.encode()).hexdigest()[:16]
+    return Path(core_cfg.BASE_DIR) / f".bootstrapped-{digest}"
+
+
 # --------------------------------------------------------------------------- #
 # Factory                                                                     #
 # --------------------------------------------------------------------------- #
@@ -53,32 +82,56 @@ def create_app() -> Flask:
     db_uri = _build_db_uri(env)
 
     app = Flask(__name__)
+    app.request_class = DiskUploadRequest  # uploads spool straight to disk
     app.config.from_mapping(
         SECRET_KEY=os.getenv("IDS_SECRET_KEY", "devkey"),
         SQLALCHEMY_DATABASE_URI=db_uri,
+        SQLALCHEMY_ENGINE_OPTIONS=engine_options(db_uri),
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        # Werkzeug hash spec; tune so one hash takes ~250 ms on this host.
+        # Stored hashes are upgraded to the current setting on next login.
+        PASSWORD_HASH_METHOD=os.getenv("IDS_PASSWORD_HASH_METHOD", "scrypt:32768:8:1"),
+        CACHE_TYPE="SimpleCache",
+        CACHE_DEFAULT_TIMEOUT=10,
+        # Largest accepted request body (training CSV uploads)
+        MAX_CONTENT_LENGTH=int(os.getenv("IDS_MAX_UPLOAD_BYTES", 4 << 30)),
     )
 
     db.init_app(app)
+    cache.init_app(app)
     register_blueprints(app)
 
+    scheduler.add_job(
+        _gc_training_dirs, "interval", minutes=PNG_GC_MINUTES, args=[app],
+        id="gc_training_dirs", replace_existing=True,
+    )
+    if not scheduler.running:
+        scheduler.start()
+
     @app.route("/")  # default root → login page
     def _root():
         return redirect(url_for("auth.login"))
 
     # --------------------- first-run bootstrap ---------------------------- #
-    with app.app_context():
-        db.create_all()
-
-        # Ensure a default admin exists
-        from ids.web.routes.auth import User  # local import to avoid cycles
-
-        if not User.query.filter_by(username="admin").first():
-            admin = User(username="admin", role="admin")
-            admin.set_password("changeme")
-            db.session.add(admin)
-            db.session.commit()
-            print("🛈 Created default admin (admin / changeme)")
+    # Runs once per database; later starts (and extra workers) only check
+    # that the users table is still there, so a wiped DB is bootstrapped again.
+    sentinel = _bootstrap_sentinel(db_uri)
+    if not os.getenv("IDS_SKIP_BOOTSTRAP"):
+        with app.app_context():
+            from ids.web.routes.auth import User  # local import to avoid cycles
+
+            if not (sentinel.exists() and inspect(db.engine).has_table(User.__tablename__)):
+                db.create_all()
+
+                # Ensure a default admin exists
+                if db.session.query(User.id).filter_by(username="admin").scalar() is None:
+                    admin = User(username="admin", role="admin")
+                    admin.set_password("changeme")
+                    db.session.add(admin)
+                    db.session.commit()
+                    print("🛈 Created default admin (admin / changeme)")
+
+                sentinel.touch()
 
     print(f"🛈 Web UI started in {env.upper()} mode — DB = {db_uri}")
     return app
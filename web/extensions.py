@@ -1,4 +1,73 @@
 """Reusable Flask extensions."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any
+
+from flask import Request
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.pool import StaticPool
 
 db = SQLAlchemy()          # the singleton SQLAlchemy object
+cache = Cache()            # in-process TTL cache for read-only endpoints
+
+def new_train_executor() -> ProcessPoolExecutor:
+    """Return a fresh model-training pool.
+
+    Workers are spawned (not forked) so they never inherit the web process's
+    TF/BLAS threads; they start lazily on the first submitted job.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, (os.cpu_count() or 2) // 2),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+# Model training runs here instead of on the request thread. Replaced by
+# ids.web.routes._training_shared when a worker dies and breaks the pool.
+train_executor = new_train_executor()
+
+
+class DiskUploadRequest(Request):
+    """Request whose multipart file parts are always written to disk.
+
+    Werkzeug keeps parts under 500 KB in memory and then re-spools them;
+    a named temp file gives one copy and constant memory for any size, and
+    lets a view keep the upload via its ``stream.name`` without re-reading it.
+    The file is removed when the request closes it.
+    """
+
+    def _get_file_stream(
+        self,
+        total_content_length: int | None,
+        content_type: str | None,
+        filename: str | None = None,
+        content_length: int | None = None,
+    ) -> IO[bytes]:
+        return tempfile.NamedTemporaryFile("wb+", suffix=".upload")
+
+
+# Server databases (Postgres): size the QueuePool for concurrent dashboard calls
+SERVER_POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 20,
+    "max_overflow": 20,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+}
+
+
+def engine_options(db_uri: str) -> dict[str, Any]:
+    """Return ``SQLALCHEMY_ENGINE_OPTIONS`` suited to *db_uri*'s backend."""
+    if not db_uri.startswith("sqlite"):
+        return dict(SERVER_POOL_OPTIONS)
+
+    options: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if db_uri in ("sqlite://", "sqlite:///:memory:"):
+        # One shared connection, or every checkout would see an empty DB
+        options["poolclass"] = StaticPool
+    return options
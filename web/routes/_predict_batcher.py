@@ -0,0 +1,81 @@
+"""Micro-batching for single-URL predictions.
+
+Request threads hand their URL to :class:`PredictBatcher` and block on a
+future; one background thread collects whatever arrives within a few
+milliseconds and answers the whole batch with a single ``predict_proba``
+call, so vectorising and model dispatch are paid once per batch.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Sequence
+
+
+class PredictBatcher:
+    """Coalesce concurrent ``(pipeline, url)`` requests into batched calls.
+
+    *predict_many(pipe, urls)* must return one row of probabilities per URL.
+    Requests for different pipelines that land in the same batch are
+    predicted separately.
+    """
+
+    def __init__(
+        self,
+        predict_many: Callable[[Any, Sequence[str]], Any],
+        *,
+        max_batch: int = 128,
+        max_wait: float = 0.005,
+    ) -> None:
+        self._predict_many = predict_many
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, pipe: Any, url: str) -> Future:
+        """Queue *url* for *pipe*; the future resolves to its probability row."""
+        if self._thread is None:  # started lazily so forked workers get their own
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="predict-batcher", daemon=True
+                    )
+                    self._thread.start()
+        future: Future = Future()
+        self._queue.put((pipe, url, future))
+        return future
+
+    # ------------------------------------------------------------------
+    def _collect(self) -> list[tuple[Any, str, Future]]:
+        """Block for one request, then take more until full or timed out."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            groups: dict[int, list[tuple[Any, str, Future]]] = {}
+            for item in self._collect():
+                groups.setdefault(id(item[0]), []).append(item)
+
+            for items in groups.values():
+                try:
+                    rows = self._predict_many(items[0][0], [url for _, url, _ in items])
+                except Exception as exc:  # surfaced to every waiting request
+                    for _, _, future in items:
+                        future.set_exception(exc)
+                else:
+                    for (_, _, future), row in zip(items, rows):
+                        future.set_result(row)
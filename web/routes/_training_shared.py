@@ -0,0 +1,169 @@
+"""Helpers shared by the training blueprints.
+
+* Results folders: the newest plots are listed on every GET/POST with one
+  ``scandir`` pass plus a bounded heap. Deleting old plots is not done on
+  the request path – :func:`prune_pngs` runs as a periodic job scheduled by
+  the app factory.
+* Background jobs: trainings run on :data:`ids.web.extensions.train_executor`
+  and are polled by job id through :func:`job_status`. A pool broken by a
+  dead worker (e.g. OOM-killed) is replaced on the next submission. A job may return its
+  plot as PNG bytes instead of a file name; the bytes are kept in memory
+  until :func:`pop_result` hands them to the page as a ``data:`` URI, and
+  are written to the results folder only when the job asked for history.
+"""
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import heapq
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable
+
+from flask import current_app, flash, jsonify
+
+from ids.ml.base import atomic_path
+import ids.web.extensions as extensions
+
+log = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------
+# Training-results folders
+# ----------------------------------------------------------------------
+def results_dir(*parts: str) -> Path:
+    """``static/training_results/<parts>`` of the current app, created if missing."""
+    directory = Path(current_app.root_path, "static", "training_results", *parts)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _scan(directory: Path) -> list[tuple[float, str]]:
+    # DirEntry caches its stat(), so each file costs one syscall at most
+    with os.scandir(directory) as it:
+        return [(e.stat().st_mtime, e.name) for e in it
+                if e.name.endswith(".png") and e.is_file()]
+
+
+def latest_pngs(directory: Path, keep: int = 6) -> list[str]:
+    """Return the *keep* newest PNG names in *directory*, newest first.
+
+    Newest is by mtime, which tracks the timestamp in the file name (the
+    name breaks ties).
+    """
+    return [name for _, name in heapq.nlargest(keep, _scan(directory))]
+
+
+def prune_pngs(directory: Path, keep: int = 6, logger: logging.Logger = log) -> int:
+    """Delete all but the *keep* newest PNGs in *directory*; return the count."""
+    try:
+        pngs = _scan(directory)
+    except FileNotFoundError:  # folder not created yet
+        return 0
+    if len(pngs) <= keep:
+        return 0
+
+    newest = {name for _, name in heapq.nlargest(keep, pngs)}
+    removed = 0
+    for _, name in pngs:
+        if name in newest:
+            continue
+        try:
+            os.unlink(directory / name)
+            removed += 1
+        except OSError as exc:
+            logger.warning("Could not delete %s: %s", name, exc)
+    return removed
+
+
+# ----------------------------------------------------------------------
+# Background training jobs
+# ----------------------------------------------------------------------
+_JOBS: dict[str, tuple[str, Future, Path | None]] = {}  # job id -> (model, future, history dir)
+_RESULTS: dict[str, bytes] = {}  # job id -> in-memory plot, until shown once
+MAX_RESULTS = 16  # unclaimed plots kept; the oldest is dropped first
+
+
+_POOL_LOCK = threading.Lock()
+
+
+def _submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Submit to the training pool, replacing it first if a worker died."""
+    pool = extensions.train_executor
+    try:
+        return pool.submit(fn, *args, **kwargs)
+    except BrokenProcessPool:
+        with _POOL_LOCK:
+            if extensions.train_executor is pool:  # not replaced by another request yet
+                log.warning("Training pool is broken (a worker died) – starting a new one")
+                pool.shutdown(wait=False, cancel_futures=True)
+                extensions.train_executor = extensions.new_train_executor()
+        return extensions.train_executor.submit(fn, *args, **kwargs)
+
+
+def submit_training(model_name: str, fn: Callable[..., str | bytes], *args: Any,
+                    history_dir: Path | None = None, **kwargs: Any) -> str:
+    """Run ``fn(*args, **kwargs)`` on the training pool; return the job id.
+
+    *fn* must be a picklable top-level function returning the plot name or
+    the plot's PNG bytes. Bytes are also saved into *history_dir* if given.
+    """
+    job_id = uuid.uuid4().hex
+    _JOBS[job_id] = (model_name, _submit(fn, *args, **kwargs), history_dir)
+    return job_id
+
+
+def _save_png(buf: bytes, directory: Path, model_name: str) -> None:
+    png_path = directory / f"{model_name}_{dt.datetime.utcnow():%Y%m%dT%H%M%S}.png"
+    try:
+        with atomic_path(png_path) as tmp:
+            tmp.write_bytes(buf)
+    except OSError as exc:
+        log.warning("Could not save %s: %s", png_path.name, exc)
+
+
+def _keep_result(job_id: str, buf: bytes, model_name: str, history_dir: Path | None) -> None:
+    _RESULTS[job_id] = buf
+    while len(_RESULTS) > MAX_RESULTS:
+        del _RESULTS[next(iter(_RESULTS))]
+    if history_dir is not None:  # off the request path
+        threading.Thread(target=_save_png, args=(buf, history_dir, model_name),
+                         name="save-training-png", daemon=True).start()
+
+
+def pop_result(job_id: str | None) -> str | None:
+    """``data:`` URI of a finished job's in-memory plot; each is returned once."""
+    buf = _RESULTS.pop(job_id, None) if job_id else None
+    if buf is None:
+        return None
+    return "data:image/png;base64," + base64.b64encode(buf).decode("ascii")
+
+
+def job_status(job_id: str):
+    """Response for a status poll; the outcome is flashed once it is done."""
+    try:
+        model_name, future, history_dir = _JOBS[job_id]
+    except KeyError:
+        return jsonify({"error": "unknown job"}), 404
+
+    if not future.done():
+        return jsonify({"done": False, "image": None})
+
+    del _JOBS[job_id]
+    try:
+        image = future.result()
+    except Exception as exc:
+        current_app.logger.exception(exc)
+        flash(f"{model_name} training failed – see server logs.", "error")
+        return jsonify({"done": True, "image": None})
+
+    if isinstance(image, bytes):  # shown by the next page view, see pop_result
+        _keep_result(job_id, image, model_name, history_dir)
+        image = None
+    flash(f"{model_name} trained successfully.")
+    return jsonify({"done": True, "image": image})
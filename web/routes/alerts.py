@@ -26,6 +26,10 @@ bp = Blueprint("alerts", __name__, url_prefix="/alerts")
 
 URL_MODELS = {"DecisionTree", "RandomForest", "LinearSVM"}
 BEHAV_MODELS = {"IsolationForest", "Autoencoder", "OneClassSVM"}
+# Derived once at import: POST validation and GET rendering reuse these
+_ALL_MODELS = frozenset(URL_MODELS | BEHAV_MODELS)
+_URL_MODELS_SORTED = tuple(sorted(URL_MODELS))
+_BEHAV_MODELS_SORTED = tuple(sorted(BEHAV_MODELS))
 MODEL_FILE = Path(config.BASE_DIR) / "current_model.txt"
 
 # ------------------------------------------------------------------ #
@@ -49,12 +53,23 @@ def _fetch_recent_alerts(limit: int = 10) -> List[dict[str, Any]]:
 # ------------------------------------------------------------------ #
 # Helper for model selection                                         #
 # ------------------------------------------------------------------ #
+_MODEL_CACHE: str | None = None  # filled on first read, updated on write
+
+
 def _current_model() -> str:
-    return MODEL_FILE.read_text().strip() if MODEL_FILE.exists() else "DecisionTree"
+    global _MODEL_CACHE
+    if _MODEL_CACHE is None:
+        try:  # one open() instead of exists() + read_text()
+            _MODEL_CACHE = MODEL_FILE.read_text().strip()
+        except FileNotFoundError:
+            _MODEL_CACHE = "DecisionTree"
+    return _MODEL_CACHE
 
 
 def _persist_model(choice: str) -> None:
+    global _MODEL_CACHE
     MODEL_FILE.write_text(choice)
+    _MODEL_CACHE = choice
 
 
 # ------------------------------------------------------------------ #
@@ -64,7 +79,7 @@ def _persist_model(choice: str) -> None:
 def alert_dashboard():
     if request.method == "POST":
         choice = request.form["model_choice"]
-        if choice not in URL_MODELS | BEHAV_MODELS:
+        if choice not in _ALL_MODELS:
             flash("Unknown model selected", "error")
             return redirect(url_for(".alert_dashboard"))
 
@@ -78,6 +93,6 @@ def alert_dashboard():
         "alert_activity.html",
         alerts=alerts,
         current_model=_current_model(),
-        url_models=sorted(URL_MODELS),
-        behaviour_models=sorted(BEHAV_MODELS),
+        url_models=_URL_MODELS_SORTED,
+        behaviour_models=_BEHAV_MODELS_SORTED,
     )
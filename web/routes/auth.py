@@ -4,10 +4,11 @@ touching `current_app` at import time.
 """
 from __future__ import annotations
 
-from functools import wraps
+from functools import lru_cache, wraps
 
 from flask import (
     Blueprint,
+    current_app,
     flash,
     g,
     redirect,
@@ -22,6 +23,18 @@ from ids.web.extensions import db           # <<< NEW – no current_app here
 
 bp = Blueprint("auth", __name__, url_prefix="/auth")
 
+# --------------------------------------------------------------------------- #
+# Password hashing                                                             #
+# --------------------------------------------------------------------------- #
+def _hash_method() -> str:
+    return current_app.config["PASSWORD_HASH_METHOD"]
+
+
+@lru_cache(maxsize=4)
+def _hash_prefix(method: str) -> str:
+    """Fully-qualified spec Werkzeug writes for *method* (defaults filled in)."""
+    return generate_password_hash("", method=method).split("$", 1)[0]
+
 # --------------------------------------------------------------------------- #
 # User model                                                                   #
 # --------------------------------------------------------------------------- #
@@ -35,19 +48,61 @@ class User(db.Model):                       # type: ignore[misc]
 
     # helpers
     def set_password(self, password: str) -> None:
-        self.password = generate_password_hash(password)
+        self.password = generate_password_hash(password, method=_hash_method())
 
     def check_password(self, password: str) -> bool:
         return check_password_hash(self.password, password)
 
+    def needs_rehash(self) -> bool:
+        """True if the stored hash was made with a different cost setting."""
+        return self.password.split("$", 1)[0] != _hash_prefix(_hash_method())
+
 # --------------------------------------------------------------------------- #
 # Blueprint hooks & decorators                                                 #
 # --------------------------------------------------------------------------- #
 
+class SessionUser:
+    """Logged-in identity read from the signed session cookie.
+
+    ``username`` and ``role`` are stored at login, so building ``g.user``
+    needs no query; the full :class:`User` row loads only via :attr:`model`.
+    """
+
+    __slots__ = ("id", "username", "role", "_model")
+
+    def __init__(self, user_id: int, username: str, role: str) -> None:
+        self.id = user_id
+        self.username = username
+        self.role = role
+        self._model: User | None = None
+
+    @property
+    def model(self) -> User | None:
+        if self._model is None:
+            self._model = db.session.get(User, self.id)
+        return self._model
+
+
+def _remember_user(user: User) -> None:
+    session["user_id"] = user.id
+    session["username"] = user.username
+    session["role"] = user.role
+
+
 @bp.before_app_request
 def _load_logged_in_user() -> None:
     user_id = session.get("user_id")
-    g.user = User.query.get(user_id) if user_id else None
+    if not user_id:
+        g.user = None
+        return
+    if "username" not in session:  # session predates cached identity
+        user = db.session.get(User, user_id)
+        if user is None:
+            session.clear()
+            g.user = None
+            return
+        _remember_user(user)
+    g.user = SessionUser(user_id, session["username"], session["role"])
 
 def login_required(view):                   # type: ignore[override]
     @wraps(view)
@@ -74,10 +129,13 @@ def admin_required(view):                   # type: ignore[override]
 def login():
     if request.method == "POST":
         user = User.query.filter_by(username=request.form["username"].strip()).first()
-        if user and user.check_password(request.form["password"].strip()):
+        password = request.form["password"].strip()
+        if user and user.check_password(password):
+            if user.needs_rehash():  # re-hash at the configured cost
+                user.set_password(password)
+                db.session.commit()
             session.clear()
-            session["user_id"] = user.id
-            session["role"] = user.role
+            _remember_user(user)
             flash("Logged in.", "success")
             return redirect(url_for("dashboard.view"))
         flash("Invalid credentials.", "error")
@@ -2,13 +2,23 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 import codecs
-from flask import Blueprint, jsonify, render_template
+import orjson
+import pandas as pd
+from flask import Blueprint, Response, current_app, render_template, stream_with_context
 from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import TextClause
 
-from ids.web.extensions import db
+from ids.web.extensions import cache, db
+
+try:
+    import ciso8601  # C parser, much faster than datetime.fromisoformat
+except ModuleNotFoundError:  # pragma: no cover – library not installed
+    ciso8601 = None  # type: ignore[assignment]
 
 bp = Blueprint("dashboard", __name__, url_prefix="/api/dashboard")
 
@@ -19,37 +29,39 @@ bp = Blueprint("dashboard", __name__, url_prefix="/api/dashboard")
 #     │   └─ …
 QUERY_DIR = Path(__file__).resolve().parent.parent.parent / "queries"
 
+# JSON endpoints are read-only aggregates; a burst of reloads within this
+# many seconds is served from the in-process cache instead of the DB
+CACHE_TTL = 10
+
 
 # --------------------------------------------------------------------------- #
 # Helper: load & adapt SQL                                                    #
 # --------------------------------------------------------------------------- #
 POSTGRES_CAST_RE = re.compile(r"::\s*\w+")
+_DATE_TRUNC_RE = re.compile(r"date_trunc\s*\(\s*'(\w+)'\s*,\s*([^)]+)\)", re.IGNORECASE)
 # 2025-08-08 05:28:01  or  2025-08-08 05:28:01.417
 DT_RE = re.compile(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d(?:\.\d+)?")
 
+
+def _date_trunc_to_strftime(m: re.Match[str]) -> str:
+    if m.group(1) == "hour":
+        return f"strftime('%Y-%m-%d %H:00:00', {m.group(2)})"
+    return f"strftime('%Y-%m-%d', {m.group(2)})"
+
+
 def _adapt_sql_for_sqlite(sql: str) -> str:
     """Best-effort convert a Postgres query into SQLite."""
     # – remove '::type' casts -------------------------------------------------
     sql = POSTGRES_CAST_RE.sub("", sql)
 
     # – date_trunc('hour', ts) ➜ strftime('%Y-%m-%d %H:00:00', ts)
-    sql = re.sub(
-        r"date_trunc\s*\(\s*'(\w+)'\s*,\s*([^)]+)\)",
-        lambda m: (
-            f"strftime('%Y-%m-%d %H:00:00', {m.group(2)})"
-            if m.group(1) == "hour"
-            else f"strftime('%Y-%m-%d', {m.group(2)})"
-        ),
-        sql,
-        flags=re.IGNORECASE,
-    )
+    sql = _DATE_TRUNC_RE.sub(_date_trunc_to_strftime, sql)
 
     return sql
 
 
-def _load_sql(file_name: str) -> str:
-    """Return the SQL string appropriate for the current DB backend."""
-    dialect = db.get_engine().dialect.name  # 'postgresql', 'sqlite', …
+def _read_sql(file_name: str, dialect: str) -> str:
+    """Read (and for SQLite, adapt) *file_name* for *dialect*."""
     if dialect == "sqlite":
         alt = QUERY_DIR / "sqlite" / file_name
         if alt.exists():
@@ -62,28 +74,119 @@ def _load_sql(file_name: str) -> str:
     return (QUERY_DIR / file_name).read_text()
 
 
-# changed today
+# (dialect, file name) → ready ``text()`` clause. Filled for every query when
+# the blueprint is registered, so the request path is a plain dict lookup.
+SQL_DIALECTS = ("postgresql", "sqlite")
+_SQL_CACHE: Dict[tuple[str, str], TextClause] = {}
+
+
+@bp.record_once
+def _precompile_sql(state) -> None:
+    for path in QUERY_DIR.glob("*.sql"):
+        for dialect in SQL_DIALECTS:
+            _SQL_CACHE[(dialect, path.name)] = text(_read_sql(path.name, dialect))
+
+
+def _compiled_sql(file_name: str, dialect: str) -> TextClause:
+    """Precompiled clause for *file_name*; compiled on demand if not warmed."""
+    clause = _SQL_CACHE.get((dialect, file_name))
+    if clause is None:  # query added after startup, or another dialect
+        clause = _SQL_CACHE[(dialect, file_name)] = text(_read_sql(file_name, dialect))
+    return clause
+
+
+def _dialect() -> str:
+    """Backend dialect name ('postgresql', 'sqlite', …), resolved once per app."""
+    name = current_app.extensions.get("dashboard_dialect")
+    if name is None:  # the engine never changes for a running app
+        name = current_app.extensions["dashboard_dialect"] = db.engine.dialect.name
+    return name
+
+
+def _load_sql(file_name: str) -> str:
+    """Return the SQL string appropriate for the current DB backend."""
+    return _compiled_sql(file_name, _dialect()).text
+
+
+# Result columns that carry timestamps (SQLite hands them back as text)
+TS_COLUMNS = frozenset(
+    {"ts", "hour_bucket", "burst_start", "burst_end", "interval_start", "interval_end"}
+)
+
+STREAM_BATCH = 1000  # rows fetched per round-trip when streaming a result
 
-def run_sql(filename: str):
-    sql  = _load_sql(filename)          # keeps the SQLite/Postgres switch
-    rows = db.session.execute(text(sql)).mappings().all()
+
+def _rows(result, dialect: str) -> Iterator[Dict[str, Any]]:
+    keys = list(result.keys())
+    if dialect != "sqlite":  # server drivers already return datetimes
+        for row in result:
+            yield dict(zip(keys, row))
+        return
+
+    # Decide per column once, then convert rows in a single pass
+    converters = [_parse_ts if key in TS_COLUMNS else None for key in keys]
+    for row in result:
+        yield {
+            key: conv(value) if conv and isinstance(value, str) else value
+            for key, conv, value in zip(keys, converters, row)
+        }
+
+
+def run_sql(filename: str, conn: Connection | None = None):
+    # keeps the SQLite/Postgres switch; the clause is precompiled at startup.
+    # *conn* lets several queries share one connection (see /bundle).
+    dialect = _dialect()
+    result = (conn or db.session).execute(_compiled_sql(filename, dialect))
     # materialise as real dicts so routes can tweak them safely
-    return [_coerce_sqlite_types(dict(r)) for r in rows]
+    return list(_rows(result, dialect))
+
+
+def iter_sql(filename: str) -> Iterator[Dict[str, Any]]:
+    """Like :func:`run_sql`, but yields rows, holding at most STREAM_BATCH."""
+    dialect = _dialect()
+    result = db.session.execute(
+        _compiled_sql(filename, dialect), execution_options={"yield_per": STREAM_BATCH}
+    )
+    yield from _rows(result, dialect)
 
 # --------------------------------------------------------------------------- #
 # Helper: normalise SQLite return types                                       #
 # --------------------------------------------------------------------------- #
-def _coerce_sqlite_types(row: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert SQLite strings → datetime objects to match Postgres behaviour."""
-    for k, v in row.items():
-        if isinstance(v, str):
-            try:
-                row[k] = datetime.fromisoformat(v.replace(" ", "T"))
-            except ValueError:
-                # Py 3.10 needs .fromisoformat("YYYY-MM-DD HH:MM:SS.SSS")
-                #row[k] = datetime.strptime(v, "%Y-%m-%d %H:%M:%S.%f")
-                pass 
-    return row
+# Parse SQLite timestamp text into datetimes to match Postgres. ciso8601
+# accepts both 'YYYY-MM-DD HH:MM:SS' and the 'T' form without a string copy.
+_parse_ts = ciso8601.parse_datetime if ciso8601 is not None else datetime.fromisoformat
+
+
+# --------------------------------------------------------------------------- #
+# Helper: JSON responses                                                      #
+# --------------------------------------------------------------------------- #
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):  # Postgres NUMERIC; matches Flask's jsonify
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj: Any) -> bytes:
+    # datetimes serialise natively as ISO-8601 UTC
+    return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NAIVE_UTC)
+
+
+def _json(obj: Any) -> Response:
+    """orjson-encoded response."""
+    return current_app.response_class(_dumps(obj), mimetype="application/json")
+
+
+def _json_stream(items: Iterable[Any]) -> Response:
+    """Stream *items* as a JSON array, encoding one element at a time."""
+    def generate() -> Iterator[bytes]:
+        yield b"["
+        for i, item in enumerate(items):
+            yield b"," + _dumps(item) if i else _dumps(item)
+        yield b"]"
+
+    return current_app.response_class(
+        stream_with_context(generate()), mimetype="application/json"
+    )
 
 
 # --------------------------------------------------------------------------- #
@@ -94,113 +197,193 @@ def view():
     return render_template("dashboard.html")
 
 
+# --------------------------------------------------------------------------- #
+# Widget payloads (shared by the per-widget routes and /bundle)               #
+# --------------------------------------------------------------------------- #
+def _top_hosts(conn: Connection | None = None):
+    return run_sql("host_count.sql", conn)
+
+
+def _alerts_by_hour(conn: Connection | None = None):
+    rows = run_sql("alerts_by_hour.sql", conn)
+    if not rows:
+        return {}
+    # hour × alert_type matrix in one pivot; absent types count as 0
+    df = pd.DataFrame(rows)
+    df["hour_bucket"] = pd.to_datetime(df["hour_bucket"]).dt.strftime("%Y-%m-%d %H:%M")
+    buckets: Dict[str, Dict[str, int]] = df.pivot_table(
+        index="hour_bucket", columns="alert_type", values="alert_cnt",
+        aggfunc="sum", fill_value=0,
+    ).to_dict(orient="index")
+    return buckets
+
+
+def _top_sources(conn: Connection | None = None):
+    return run_sql("top_sources.sql", conn)
+
+
+def _ddos_point(r: Dict[str, Any]) -> Dict[str, Any]:
+    return {                    # SQLite returns 'YYYY-MM-DD HH:MM:SS'
+        "timestamp": r["ts"],              # <- keep as-is
+        "count": int(r["ddos_window"])
+    }
+
+
+def _ddos_last_10m(conn: Connection | None = None):
+    return [_ddos_point(r) for r in run_sql("ddos_last_10m.sql", conn)]
+
+
+def _scan_burst(r: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "src_ip":          r["src_ip"],
+        "burst_start":     r["burst_start"],   # ISO-8601 string from SQLite
+        "burst_end":       r["burst_end"],
+        "scans_in_burst":  int(r["scans_in_burst"]),
+    }
+
+
+def _scan_bursts(conn: Connection | None = None):
+    return [_scan_burst(r) for r in run_sql("scan_bursts.sql", conn)]
+
+
+def _top_bandwidth(conn: Connection | None = None):
+    return run_sql("top_bandwidth_taker.sql", conn)  # counts CAST in SQL
+
+
+def _avg_pkt_size(conn: Connection | None = None):
+    return run_sql("avg_pkt_size_per_host.sql", conn)  # numeric types CAST in SQL
+
+
+def _heavy_outgoing(conn: Connection | None = None):
+    return run_sql("host_with_heavy_outgoing.sql", conn)  # numeric types CAST in SQL
+
+
+def _port_fanout(conn: Connection | None = None):
+    rows = run_sql("port_fan_out_check.sql", conn)
+    if not rows:
+        return []
+    # peak fan-out per host, top 10
+    top = (
+        pd.DataFrame(rows)
+        .astype({"unique_dst_ports": int})
+        .groupby("host_ip")["unique_dst_ports"].max()
+        .nlargest(10)
+    )
+    return [{"host_ip": h, "unique_dst_ports": p} for h, p in top.items()]
+
+
+def _source_spike(r: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "host_ip": r["host_ip"],
+        "interval_start": r["interval_start"],
+        "unique_src_ips": int(r["unique_src_ips"]),
+        "prev_src_ips": int(r["prev_src_ips"]),
+        "new_src_jump": int(r["new_src_jump"]),
+    }
+
+
+def _new_source_spike(conn: Connection | None = None):
+    return [_source_spike(r) for r in run_sql("new_source_spike.sql", conn)]
+
+
+def _rolling_pkt_30m_total(conn: Connection | None = None):
+    rows = run_sql("rolling_30_min_pkt_count.sql", conn)
+    if not rows:
+        return []
+    # groupby sorts by interval_end, matching the old sorted(totals)
+    totals = (
+        pd.DataFrame(rows)
+        .astype({"pkts_last_30m": int})
+        .groupby("interval_end")["pkts_last_30m"].sum()
+    )
+    return [
+        {"interval_end": t, "total_pkts": n}
+        for t, n in zip(totals.index.to_pydatetime(), totals.tolist())
+    ]
+
+
+# Widgets rendered by dashboard.html, fetched together via /bundle
+WIDGETS: Dict[str, Callable[[Connection | None], Any]] = {
+    "alerts_by_hour": _alerts_by_hour,
+    "top_sources": _top_sources,
+    "ddos_last_10m": _ddos_last_10m,
+    "scan_bursts": _scan_bursts,
+    "top_bandwidth": _top_bandwidth,
+    "avg_pkt_size": _avg_pkt_size,
+    "heavy_outgoing": _heavy_outgoing,
+    "port_fanout": _port_fanout,
+    "new_source_spike": _new_source_spike,
+    "rolling_pkt_30m_total": _rolling_pkt_30m_total,
+}
+
+
+@bp.route("/bundle")
+@cache.cached(timeout=CACHE_TTL)
+def bundle():
+    """Every dashboard widget in one response, queried over one connection."""
+    with db.engine.connect() as conn:
+        payload = {name: build(conn) for name, build in WIDGETS.items()}
+    return _json(payload)
+
+
 @bp.route("/top_hosts")
+@cache.cached(timeout=CACHE_TTL)
 def api_top_hosts():
-    return jsonify(run_sql("host_count.sql"))
+    return _json(_top_hosts())
 
 
 @bp.route("/alerts_by_hour")
+@cache.cached(timeout=CACHE_TTL)
 def alerts_by_hour():
-    rows = run_sql("alerts_by_hour.sql")
-    buckets: Dict[str, Dict[str, int]] = {}
-    for row in rows:
-        hour = (row["hour_bucket"].strftime("%Y-%m-%d %H:%M")
-        if hasattr(row["hour_bucket"], "strftime")
-        else datetime.fromisoformat(row["hour_bucket"]).strftime("%Y-%m-%d %H:%M"))
-        buckets.setdefault(hour, {})[row["alert_type"]] = row["alert_cnt"]
-    return jsonify(buckets)
+    return _json(_alerts_by_hour())
 
 
 @bp.route("/top_sources")
+@cache.cached(timeout=CACHE_TTL)
 def top_sources():
-    return jsonify(run_sql("top_sources.sql"))
+    return _json(_top_sources())
 
 
 @bp.route("/ddos_last_10m")
-def ddos_last_10m():
-    rows = run_sql("ddos_last_10m.sql")
-    return jsonify([
-        {                       # SQLite returns 'YYYY-MM-DD HH:MM:SS'
-            "timestamp": r["ts"],          # <- keep as-is
-            "count": int(r["ddos_window"])
-        }
-        for r in rows
-    ])
+def ddos_last_10m():  # streamed row by row, so not cached (/bundle is)
+    return _json_stream(map(_ddos_point, iter_sql("ddos_last_10m.sql")))
 
 
 @bp.route("/scan_bursts")
-def scan_bursts():
-    rows = run_sql("scan_bursts.sql")        # already a list of dicts
-    payload = [
-        {
-            "src_ip":          r["src_ip"],
-            "burst_start":     r["burst_start"],   # ISO-8601 string from SQLite
-            "burst_end":       r["burst_end"],
-            "scans_in_burst":  int(r["scans_in_burst"]),
-        }
-        for r in rows
-    ]
-    return jsonify(payload)
+def scan_bursts():  # streamed row by row, so not cached (/bundle is)
+    return _json_stream(map(_scan_burst, iter_sql("scan_bursts.sql")))
 
 
 @bp.route("/top_bandwidth")
+@cache.cached(timeout=CACHE_TTL)
 def top_bandwidth():
-    rows = run_sql("top_bandwidth_taker.sql")
-    for r in rows:  # ensure JSON-friendly ints
-        r["bytes_last_10m"] = int(r["bytes_last_10m"])
-        r["pkts_last_10m"] = int(r["pkts_last_10m"])
-    return jsonify(rows)
+    return _json(_top_bandwidth())
 
 
 @bp.route("/avg_pkt_size")
+@cache.cached(timeout=CACHE_TTL)
 def avg_pkt_size():
-    rows = run_sql("avg_pkt_size_per_host.sql")
-    for r in rows:
-        r["avg_pkt_size_bytes"] = float(r["avg_pkt_size_bytes"])
-        r["total_pkts"] = int(r["total_pkts"])
-    return jsonify(rows)
+    return _json(_avg_pkt_size())
 
 
 @bp.route("/heavy_outgoing")
+@cache.cached(timeout=CACHE_TTL)
 def heavy_outgoing():
-    rows = run_sql("host_with_heavy_outgoing.sql")
-    for r in rows:
-        r["in_pkts"] = int(r["in_pkts"])
-        r["out_pkts"] = int(r["out_pkts"])
-        r["out_in_ratio"] = float(r["out_in_ratio"])
-    return jsonify(rows)
+    return _json(_heavy_outgoing())
 
 
 @bp.route("/port_fanout")
+@cache.cached(timeout=CACHE_TTL)
 def port_fanout():
-    rows = run_sql("port_fan_out_check.sql")
-    agg: Dict[str, int] = {}
-    for r in rows:
-        agg[r["host_ip"]] = max(int(r["unique_dst_ports"]), agg.get(r["host_ip"], 0))
-    top = sorted(agg.items(), key=lambda kv: kv[1], reverse=True)[:10]
-    return jsonify([{"host_ip": h, "unique_dst_ports": p} for h, p in top])
+    return _json(_port_fanout())
 
 
 @bp.route("/new_source_spike")
-def new_source_spike():
-    rows = run_sql("new_source_spike.sql")
-    return jsonify([
-        {
-            "host_ip": r["host_ip"],
-            "interval_start": r["interval_start"].isoformat(),
-            "unique_src_ips": int(r["unique_src_ips"]),
-            "prev_src_ips": int(r["prev_src_ips"]),
-            "new_src_jump": int(r["new_src_jump"]),
-        }
-        for r in rows
-    ])
+def new_source_spike():  # streamed row by row, so not cached (/bundle is)
+    return _json_stream(map(_source_spike, iter_sql("new_source_spike.sql")))
 
 
 @bp.route("/rolling_pkt_30m_total")
+@cache.cached(timeout=CACHE_TTL)
 def rolling_pkt_30m_total():
-    rows = run_sql("rolling_30_min_pkt_count.sql")
-    totals: Dict[str, int] = {}
-    for r in rows:
-        ts = r["interval_end"] 
-        totals[ts] = totals.get(ts, 0) + int(r["pkts_last_30m"])
-    return jsonify([{"interval_end": t, "total_pkts": totals[t]} for t in sorted(totals)])
+    return _json(_rolling_pkt_30m_total())
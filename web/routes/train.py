@@ -1,13 +1,16 @@
 ﻿from flask import (
     Blueprint, render_template, request,
-    flash, current_app, url_for
+    flash, url_for
 )
 from ids.ml.factory import ModelFactory
 from ids.core import config
 import pandas as pd
-from pathlib import Path
+from collections import deque
 import os, re
 from datetime import datetime
+from functools import lru_cache
+
+from ids.web.routes._training_shared import latest_pngs, results_dir
 
 bp = Blueprint("train", __name__, url_prefix="/train")
 
@@ -16,21 +19,27 @@ bp = Blueprint("train", __name__, url_prefix="/train")
 # Helpers
 # ----------------------------------------------------------------------
 _TIMESTAMP_RE = re.compile(r"_(\d{8}T\d{6})")
+URL_DATASET = config.BASE_DIR / "data" / "malicious_phish.csv"
+BASELINE_DATASET = config.BASE_DIR / "data" / "normal_traffic_baseline.csv"
 
+@lru_cache(maxsize=128)  # pure fname → datetime mapping
 def extract_timestamp(fname: str) -> datetime:
     m = _TIMESTAMP_RE.search(fname)
     return datetime.strptime(m.group(1), "%Y%m%dT%H%M%S") if m else datetime.min
 
 
-def _latest_pngs(directory: Path, keep: int = 6) -> list[str]:
-    files = [f.name for f in directory.iterdir() if f.suffix == ".png"]
-    files.sort(key=extract_timestamp, reverse=True)
-    for stale in files[keep:]:
-        try:
-            (directory / stale).unlink()
-        except Exception as exc:
-            current_app.logger.warning("Could not delete %s: %s", stale, exc)
-    return files[:keep]
+# Training CSVs are parsed once per (path, mtime); editing a file on disk
+# changes its mtime and therefore misses the cache. Callers must not mutate.
+@lru_cache(maxsize=4)
+def _load_csv(path_str: str, mtime: float) -> pd.DataFrame:
+    return pd.read_csv(path_str)
+
+
+@lru_cache(maxsize=4)
+def _load_numeric(path_str: str, mtime: float):
+    numeric = _load_csv(path_str, mtime).select_dtypes(include="number").values
+    numeric.flags.writeable = False  # shared across requests
+    return numeric
 
 
 # ----------------------------------------------------------------------
@@ -38,34 +47,31 @@ def _latest_pngs(directory: Path, keep: int = 6) -> list[str]:
 # ----------------------------------------------------------------------
 @bp.route("/", methods=["GET", "POST"])
 def train_model():
-    training_dir = Path(current_app.root_path, "static", "training_results")
-    training_dir.mkdir(parents=True, exist_ok=True)
+    training_dir = results_dir()
 
     # Always show up-to-date thumbnails
-    recent_images = _latest_pngs(training_dir)
+    recent_images = deque(latest_pngs(training_dir), maxlen=6)
 
     if request.method == "POST":
         model_name: str = request.form["model_type"]
 
         # ── SUPERVISED models ────────────────────────────────────────────
         if model_name in {"DecisionTree", "RandomForest", "LinearSVM"}:
-            df = pd.read_csv(config.BASE_DIR / "data" / "malicious_phish.csv")
+            df = _load_csv(str(URL_DATASET), URL_DATASET.stat().st_mtime)
             X, y = df["url"], df["type"]
             model = ModelFactory.create(model_name)
             plot_path = model.train_and_plot(X, y, save_dir=training_dir)
 
         # ── UNSUPERVISED / ANOMALY models ───────────────────────────────
         else:
-            df = pd.read_csv(
-                config.BASE_DIR / "data" / "normal_traffic_baseline.csv"
+            numeric = _load_numeric(
+                str(BASELINE_DATASET), BASELINE_DATASET.stat().st_mtime
             )
-            numeric = df.select_dtypes(include="number").values
             model = ModelFactory.create(model_name)
             plot_path = model.train_and_plot(numeric, save_dir=training_dir)
 
         flash(f"{model_name} trained successfully.")
-        recent_images.insert(0, plot_path.name)
-        recent_images = recent_images[:6]
+        recent_images.appendleft(plot_path.name)  # maxlen drops the oldest
 
         return render_template(
             "train_model.html",
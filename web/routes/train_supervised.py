@@ -2,28 +2,43 @@
 
 URL prefix: /train/supervised
 Templates: re‑uses *train_model.html*
-Static results saved to: static/training_results/supervised
+Static results saved to: static/training_results/supervised (when the
+user asks to keep history; otherwise plots are only rendered in memory)
 """
 
 from flask import Blueprint, render_template, request, flash, current_app
 from ids.ml.factory import ModelFactory
 from ids.core import config
+from ids.web.routes._predict_batcher import PredictBatcher
+from ids.web.routes._training_shared import (
+    job_status, latest_pngs, pop_result, results_dir, submit_training,
+)
 import pandas as pd
 import numpy as np
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-import re
 import os
-from datetime import datetime
-# NEW ────────────────────────────────────────────────────────────────────────
+import shutil
+import threading
+import warnings
 from werkzeug.utils import secure_filename
 import joblib, tempfile
+from sklearn import config_context
+from threadpoolctl import ThreadpoolController
+
+try:  # optional Arrow CSV parser: threaded full reads, fast streaming
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ModuleNotFoundError:  # pragma: no cover – library not installed
+    pa = None  # type: ignore[assignment]
+    pacsv = None  # type: ignore[assignment]
 
 bp = Blueprint("train_supervised", __name__, url_prefix="/train/supervised")
 
 # ----------------------------------------------------------------------
 # Helpers
 # ----------------------------------------------------------------------
-_TIMESTAMP_RE = re.compile(r"_(\d{8}T\d{6})")
 #NEW
 PICKLE_DIR = Path(config.BASE_DIR, "ml_models")          # where .pkl files live
 PICKLE_DIR.mkdir(exist_ok=True)
@@ -32,47 +47,199 @@ _SUPPORTED = {"DecisionTree": "decision_tree.pkl",
               "RandomForest":  "random_forest.pkl",
               "LinearSVM":     "linear_svm.pkl"}
 
+# Pipelines are unpickled once per (path, mtime); a retrain rewrites the
+# .pkl and therefore misses the cache. Shared across requests – read only.
+# Large arrays (e.g. linear coef_) are memory-mapped, so the page cache is
+# shared by every worker process; compressed legacy pickles load normally.
+@lru_cache(maxsize=len(_SUPPORTED))
+def _cached_load(pkl_path: str, mtime_ns: int):
+    with warnings.catch_warnings():  # "mmap_mode ignored" on compressed files
+        warnings.simplefilter("ignore", UserWarning)
+        pipe = joblib.load(pkl_path, mmap_mode="r")
+    clf = pipe.steps[-1][1]
+    if hasattr(clf, "n_jobs"):  # one URL per call: no joblib workers
+        clf.n_jobs = 1
+    return pipe
+
+
+# BLAS libraries are inspected once; the predict path pins them to 1 thread
+_THREADPOOLS = ThreadpoolController()
+
+
+def _predict_many(pipe, urls: list[str]):
+    """Class probabilities for a batch of URLs, without per-call overheads.
+
+    Skips sklearn's NaN/Inf scan (text input is always finite) and avoids
+    spinning up a BLAS thread team for a small matrix.
+    """
+    with _THREADPOOLS.limit(limits=1, user_api="blas"), config_context(assume_finite=True):
+        return pipe.predict_proba(urls)
+
+
+# Concurrent /predict requests are answered in micro-batches
+_BATCHER = PredictBatcher(_predict_many)
+
+
+def _predict_one(pipe, url: str):
+    """Class probabilities for a single URL (batched with concurrent calls)."""
+    return _BATCHER.submit(pipe, url).result()
+
+
+TOP_K = 3  # classes shown with their probability on the predict page
+
+
+def _top_classes(classes, proba_vec, k: int = TOP_K):
+    """Return ``(best_class, {class: probability})`` for the *k* likeliest classes."""
+    k = min(k, proba_vec.size)
+    idx = np.argpartition(-proba_vec, k - 1)[:k]  # O(n) selection, then sort k
+    idx = idx[np.argsort(-proba_vec[idx])]
+    return classes[idx[0]], {classes[i]: round(float(proba_vec[i]), 3) for i in idx}
+
+
 def _load_pipeline(model_name: str):
     """Return a sklearn Pipeline for *model_name* or raise FileNotFoundError."""
     pkl = PICKLE_DIR / _SUPPORTED[model_name]
-    if not pkl.exists():
-        raise FileNotFoundError(f"Train {model_name} first – {pkl.name} is missing")
-    return joblib.load(pkl)
+    try:
+        mtime_ns = pkl.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Train {model_name} first – {pkl.name} is missing") from None
+    return _cached_load(str(pkl), mtime_ns)
 
-#NEW
-def _extract_timestamp(fname: str) -> datetime:
-    m = _TIMESTAMP_RE.search(fname)
-    return datetime.strptime(m.group(1), "%Y%m%dT%H%M%S") if m else datetime.min
+
+def _warm_pipelines(logger) -> None:
+    """Load every trained pipeline into the cache and run one dummy predict.
+
+    The predict faults in memory-mapped pages and sklearn's lazy imports, so
+    the first real request pays neither.
+    """
+    for model_name in _SUPPORTED:
+        try:
+            _load_pipeline(model_name).predict(["http://example.com/"])
+        except FileNotFoundError:
+            continue  # not trained yet
+        except Exception as exc:
+            logger.warning("Could not pre-warm %s: %s", model_name, exc)
+
+
+@bp.record_once
+def _start_warmup(state) -> None:
+    threading.Thread(
+        target=_warm_pipelines, args=(state.app.logger,),
+        name="pipeline-warmup", daemon=True,
+    ).start()
+
+CHUNK_SIZE = 200_000  # CSV rows per training chunk
+
+
+ARROW_BLOCK_SIZE = 16 << 20  # bytes of CSV per Arrow parse block
 
 
-def _latest_pngs(folder: Path, limit: int = 6) -> list[str]:
-    """Return up-to-date list of PNG filenames, newest first."""
-    return sorted((p.name for p in folder.glob("*.png")),
-                  key=lambda n: os.path.getmtime(folder / n),
-                  reverse=True)[:limit]
+def _arrow_options(columns: list[str]):
+    """Arrow read/convert options for the *columns* of a url/type CSV."""
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE)
+    convert_options = pacsv.ConvertOptions(
+        include_columns=columns,
+        # dictionary-encoded labels come out as pandas categoricals
+        column_types={"url": pa.string(), "type": pa.dictionary(pa.int32(), pa.string())},
+    )
+    return read_options, convert_options
+
+
+def _read_url_csv(csv_path: Path, columns: list[str]) -> pd.DataFrame:
+    """Read *columns* of a url/type CSV, multi-threaded when pyarrow is present."""
+    if pacsv is None:
+        return pd.read_csv(csv_path, usecols=columns,
+                           dtype={"url": "string", "type": "category"})
+    read_options, convert_options = _arrow_options(columns)
+    table = pacsv.read_csv(csv_path, read_options=read_options,
+                           convert_options=convert_options)
+    return table.to_pandas()
+
+
+def _iter_labelled(csv_path: Path, chunksize: int = CHUNK_SIZE):
+    """Yield ``(urls, labels)`` chunks so the whole CSV is never in memory."""
+    if pacsv is None:
+        with pd.read_csv(
+            csv_path,
+            chunksize=chunksize,
+            usecols=["url", "type"],
+            dtype={"url": "string", "type": "category"},
+        ) as reader:
+            for chunk in reader:
+                yield chunk["url"], chunk["type"]
+        return
+
+    # Arrow's streaming reader is single-threaded but still far quicker than
+    # the pandas C parser; its blocks are re-cut into *chunksize* rows
+    read_options, convert_options = _arrow_options(["url", "type"])
+    with pacsv.open_csv(csv_path, read_options=read_options,
+                        convert_options=convert_options) as reader:
+        for batch in reader:
+            for start in range(0, batch.num_rows, chunksize):
+                chunk = batch.slice(start, chunksize).to_pandas()
+                yield chunk["url"], chunk["type"]
+
+
+def _label_classes(csv_path: Path) -> list[str]:
+    """Every distinct label, read up-front for incremental (partial_fit) models."""
+    labels = _read_url_csv(csv_path, ["type"])["type"]
+    return sorted(labels.cat.categories)
+
+
+def _run_training(model_name: str, csv_path: Path, remove_csv: bool = False) -> bytes:
+    """Train *model_name* on *csv_path* in a worker process; return the plot PNG.
+
+    Top-level so the training pool can pickle it. Nothing is written to the
+    results folder here – the web process does that if history is wanted.
+    """
+    try:
+        model = ModelFactory.create(model_name)
+        cm_png, _roc_png = model.train_and_plot_iter(
+            _iter_labelled(csv_path),
+            classes=_label_classes(csv_path),
+            save_dir=None,
+        )
+        return cm_png
+    finally:
+        if remove_csv:  # uploaded temp file
+            csv_path.unlink(missing_ok=True)
+
+
+def _keep_upload(file_obj) -> Path:
+    """Return a path to the uploaded CSV that outlives the request.
+
+    The part is already on disk (see ``DiskUploadRequest``), so it is
+    hard-linked rather than copied; other streams are copied in 1 MiB blocks.
+    """
+    spooled = file_obj.stream
+    if hasattr(spooled, "name") and isinstance(spooled.name, str):
+        spooled.flush()
+        csv_path = Path(spooled.name).with_suffix(".csv")
+        try:
+            os.link(spooled.name, csv_path)
+            return csv_path
+        except OSError:
+            pass
+
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as out:
+        spooled.seek(0)
+        shutil.copyfileobj(spooled, out, length=1 << 20)
+    return Path(out.name)
 
 
 # ----------------------------------------------------------------------
 # Route
 # ----------------------------------------------------------------------
-# imports – add secure_filename for safety
-from werkzeug.utils import secure_filename
-import tempfile
-
 @bp.route("/", methods=["GET", "POST"])
 def train_supervised_model():
-    training_dir = Path(current_app.root_path,
-                        "static", "training_results", "supervised")
-    training_dir.mkdir(parents=True, exist_ok=True)
-
-    recent_images = _latest_pngs(training_dir)
-    supervised_models = {"DecisionTree", "RandomForest", "LinearSVM"}
+    training_dir = results_dir("supervised")
+    recent_images = deque(latest_pngs(training_dir), maxlen=6)
 
     if request.method == "POST":
         model_name: str = request.form["model_type"]
 
         # 1️⃣ ---------- validate model -------------------------------------
-        if model_name not in supervised_models:
+        if model_name not in _SUPPORTED:
             flash(f"{model_name} is not configured as a supervised model.", "error")
             return render_template("train_supervised.html",
                                    training_image=None, recent_images=recent_images)
@@ -81,34 +248,40 @@ def train_supervised_model():
         file_obj = request.files.get("csv_file")          # ← new
         if file_obj and file_obj.filename:
             fname = secure_filename(file_obj.filename)
-            with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
-                file_obj.save(tmp.name)
-                csv_path = Path(tmp.name)
+            csv_path = _keep_upload(file_obj)
+            uploaded = True
 
             flash(f"Custom dataset “{fname}” uploaded.", "info")
         else:
             # fall-back to the default dataset
             csv_path = config.BASE_DIR / "data" / "malicious_phish.csv"
+            uploaded = False
             flash("No file chosen – using bundled malicious_phish.csv", "warning")
 
-        # 3️⃣ ---------- LOAD + TRAIN ---------------------------------------
-        df = pd.read_csv(csv_path)
-        X, y = df["url"], df["type"]
-
-        model = ModelFactory.create(model_name)
-        plot_path = model.train_and_plot(X, y, save_dir=training_dir)
-
-        flash(f"{model_name} trained successfully.")
-        recent_images.insert(0, plot_path.name)
-        recent_images = recent_images[:6]
+        # 3️⃣ ---------- TRAIN IN THE BACKGROUND ---------------------------
+        keep_history = request.form.get("keep_history") == "on"
+        job_id = submit_training(model_name, _run_training, model_name, csv_path,
+                                 remove_csv=uploaded,
+                                 history_dir=training_dir if keep_history else None)
 
+        flash(f"{model_name} training started.", "info")
         return render_template("train_supervised.html",
-                               training_image=plot_path.name,
-                               recent_images=recent_images)
+                               training_image=None,
+                               recent_images=recent_images,
+                               job_id=job_id)
 
-    # GET
+    # GET – after a job finishes the page is reloaded with ?job=<id>
     return render_template("train_supervised.html",
-                           training_image=None, recent_images=recent_images)
+                           training_image=pop_result(request.args.get("job")),
+                           recent_images=recent_images)
+
+
+@bp.route("/status/<job_id>")
+def training_status(job_id: str):
+    """Poll a background training job; the outcome is flashed once it is done."""
+    return job_status(job_id)
+
+
 # ─────────────────────────  NEW PREDICTION END-POINT  ──────────────────────
 @bp.route("/predict", methods=["GET", "POST"])
 def predict_url_type():
@@ -122,17 +295,13 @@ def predict_url_type():
 
         try:
             pipe = _load_pipeline(model_name)
-            proba = pipe.predict_proba([url_value])[0]
-            prediction = pipe.classes_[np.argmax(proba)]
-            proba = dict(zip(pipe.classes_, proba.round(3)))
+            prediction, proba = _top_classes(pipe.classes_, _predict_one(pipe, url_value))
         except FileNotFoundError as exc:
             flash(str(exc), "error")
         except Exception as exc:
             current_app.logger.exception(exc)
             flash("Prediction failed – see server logs.", "error")
-    training_dir = Path(current_app.root_path,
-                        "static", "training_results", "supervised")
-    recent_images = _latest_pngs(training_dir)
+    recent_images = latest_pngs(results_dir("supervised"))
     return render_template(
         "train_supervised.html",           # reuse template
         show_predict=True,                 # toggle second tab
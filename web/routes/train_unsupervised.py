@@ -5,13 +5,15 @@ Templates: re‑uses *train_model.html*
 Static results saved to: static/training_results/unsupervised
 """
 
-from flask import Blueprint, render_template, request, flash, current_app
+from flask import Blueprint, render_template, request, flash
 from ids.ml.factory import ModelFactory
 from ids.core import config
+from ids.web.routes._training_shared import (
+    job_status, latest_pngs, results_dir, submit_training,
+)
 import pandas as pd
+from collections import deque
 from pathlib import Path
-import re
-from datetime import datetime
 
 
 bp = Blueprint("train_unsupervised", __name__, url_prefix="/train/unsupervised")
@@ -19,23 +21,42 @@ bp = Blueprint("train_unsupervised", __name__, url_prefix="/train/unsupervised")
 # ----------------------------------------------------------------------
 # Helpers
 # ----------------------------------------------------------------------
-_TIMESTAMP_RE = re.compile(r"_(\d{8}T\d{6})")
+CHUNK_SIZE = 200_000  # CSV rows per training chunk
 
 
-def _extract_timestamp(fname: str) -> datetime:
-    m = _TIMESTAMP_RE.search(fname)
-    return datetime.strptime(m.group(1), "%Y%m%dT%H%M%S") if m else datetime.min
+HEADER_SAMPLE_ROWS = 1_000  # rows read up-front to find the numeric columns
 
 
-def _latest_pngs(directory: Path, keep: int = 6) -> list[str]:
-    files = [f.name for f in directory.iterdir() if f.suffix == ".png"]
-    files.sort(key=_extract_timestamp, reverse=True)
-    for stale in files[keep:]:
-        try:
-            (directory / stale).unlink()
-        except Exception as exc:
-            current_app.logger.warning("Could not delete %s: %s", stale, exc)
-    return files[:keep]
+def _numeric_columns(csv_path: Path) -> list[str]:
+    """Names of the numeric columns of *csv_path*, inferred from its first rows."""
+    head = pd.read_csv(csv_path, nrows=HEADER_SAMPLE_ROWS)
+    return list(head.select_dtypes(include="number").columns)
+
+
+def _iter_numeric(csv_path: Path, chunksize: int = CHUNK_SIZE):
+    """Yield the numeric columns of *csv_path* as float32 ndarray chunks.
+
+    Only those columns are parsed, straight into float32 (which the models
+    accept as-is), so the one copy into the chunk array moves half the bytes.
+    """
+    with pd.read_csv(
+        csv_path,
+        chunksize=chunksize,
+        usecols=_numeric_columns(csv_path),
+        dtype="float32",
+    ) as reader:
+        for chunk in reader:
+            yield chunk.to_numpy(copy=False)
+
+
+def _run_training(model_name: str, csv_path: Path, training_dir: Path) -> str:
+    """Train *model_name* on *csv_path* in a worker process; return the plot name.
+
+    Top-level so the training pool can pickle it.
+    """
+    model = ModelFactory.create(model_name)
+    plot_path = model.train_and_plot_iter(_iter_numeric(csv_path), save_dir=training_dir)
+    return plot_path.name
 
 
 # ----------------------------------------------------------------------
@@ -43,10 +64,9 @@ def _latest_pngs(directory: Path, keep: int = 6) -> list[str]:
 # ----------------------------------------------------------------------
 @bp.route("/", methods=["GET", "POST"])
 def train_unsupervised_model():
-    training_dir = Path(current_app.root_path, "static", "training_results", "unsupervised")
-    training_dir.mkdir(parents=True, exist_ok=True)
+    training_dir = results_dir("unsupervised")
 
-    recent_images = _latest_pngs(training_dir)
+    recent_images = deque(latest_pngs(training_dir), maxlen=6)
 
     # You can adjust this set to the models supported by your ModelFactory
     unsupervised_models = {"IsolationForest", "Autoencoder", "OneClassSVM", "KMeans"}
@@ -58,18 +78,20 @@ def train_unsupervised_model():
             flash(f"{model_name} is not configured as an unsupervised model.", "error")
             return render_template("train_model.html", training_image=None, recent_images=recent_images)
 
-        # Load baseline (unlabelled) network‑traffic dataset
-        df = pd.read_csv(config.BASE_DIR / "data" / "normal_traffic_baseline.csv")
-        numeric = df.select_dtypes(include="number").values
-
-        model = ModelFactory.create(model_name)
-        plot_path = model.train_and_plot(numeric, save_dir=training_dir)
+        # The worker streams the baseline (unlabelled) network‑traffic dataset in chunks
+        baseline = config.BASE_DIR / "data" / "normal_traffic_baseline.csv"
 
-        flash(f"{model_name} trained successfully.")
-        recent_images.insert(0, plot_path.name)
-        recent_images = recent_images[:6]
+        job_id = submit_training(model_name, _run_training, model_name, baseline, training_dir)
 
-        return render_template("train_unsupervised.html", training_image=plot_path.name, recent_images=recent_images)
+        flash(f"{model_name} training started.")
+        return render_template("train_unsupervised.html", training_image=None,
+                               recent_images=recent_images, job_id=job_id)
 
     # GET
     return render_template("train_unsupervised.html", training_image=None, recent_images=recent_images)
+
+
+@bp.route("/status/<job_id>")
+def training_status(job_id: str):
+    """Poll a background training job; the outcome is flashed once it is done."""
+    return job_status(job_id)
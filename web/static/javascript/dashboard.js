@@ -9,7 +9,10 @@ let autoRefresh = false;
       autoRefresh = !autoRefresh;
       document.getElementById("autoRefreshState").innerText = autoRefresh ? "On" : "Off";
       if (autoRefresh) {
-        refreshInterval = setInterval(draw, 10000);
+        refreshInterval = setInterval(() => {
+          bundle = loadJSON('/api/dashboard/bundle');
+          draw();
+        }, 10000);
       } else {
         clearInterval(refreshInterval);
       }
@@ -43,11 +46,15 @@ let autoRefresh = false;
       return r.json();
     }
 
+    // One request feeds every widget; auto-refresh re-fetches it
+    let bundle = loadJSON('/api/dashboard/bundle');
+    const widget = name => bundle.then(b => b[name]);
+
     async function draw() {
-      const hourly        = await loadJSON('/api/dashboard/alerts_by_hour');
-      const top           = await loadJSON('/api/dashboard/top_sources');
-      const ddos          = await loadJSON('/api/dashboard/ddos_last_10m');
-      const bursts        = await loadJSON('/api/dashboard/scan_bursts');
+      const hourly        = await widget('alerts_by_hour');
+      const top           = await widget('top_sources');
+      const ddos          = await widget('ddos_last_10m');
+      const bursts        = await widget('scan_bursts');
       const hours = Object.keys(hourly).sort();
       const synData = hours.map(h => hourly[h]['SYN'] || 0);
       new Chart(document.getElementById('hourlyChart'), {
@@ -130,8 +137,7 @@ const ddosVals = ddos.map(r => r.count);
  *   - Line  : packet count in last 10 min
  */
 document.addEventListener('DOMContentLoaded', () => {
-  fetch('/api/dashboard/top_bandwidth')
-    .then(r => r.json())
+  widget('top_bandwidth')
     .then(data => {
       const labels = data.map(d => d.host_ip);
       const bytes  = data.map(d => d.bytes_last_10m);
@@ -183,8 +189,7 @@ document.addEventListener('DOMContentLoaded', () => {
     .catch(console.error);
 });
 /* ─── Chart #2 – average pkt size + total pkts (all-time) ─────────── */
-fetch('/api/dashboard/avg_pkt_size')
-  .then(r => r.json())
+widget('avg_pkt_size')
   .then(data => {
     const labels   = data.map(d => d.host_ip);
     const avgSize  = data.map(d => d.avg_pkt_size_bytes);
@@ -215,8 +220,7 @@ fetch('/api/dashboard/avg_pkt_size')
   })
   .catch(console.error);
 /* ── Chart #3 – heavy outgoing bias (last hour) ───────────────────── */
-fetch('/api/dashboard/heavy_outgoing')
-  .then(r => r.json())
+widget('heavy_outgoing')
   .then(data => {
     const labels   = data.map(d => d.host_ip);
     const inPkts   = data.map(d => d.in_pkts);
@@ -291,8 +295,7 @@ fetch('/api/dashboard/heavy_outgoing')
   })
   .catch(console.error);
 /* ── Chart #4 – port fan-out (unique dst ports) ────────────────────── */
-fetch('/api/dashboard/port_fanout')
-  .then(r => r.json())
+widget('port_fanout')
   .then(data => {
     const labels = data.map(d => d.host_ip);
     const ports  = data.map(d => d.unique_dst_ports);
@@ -331,8 +334,7 @@ fetch('/api/dashboard/port_fanout')
   })
   .catch(console.error);
  /* ── Chart – new-source spikes (last 12 h) ─────────────────────────── */
-fetch('/api/dashboard/new_source_spike')
-  .then(r => r.json())
+widget('new_source_spike')
   .then(data => {
     // label = "<host> @ HH:MM"
     const labels = data.map(d => {
@@ -376,8 +378,7 @@ fetch('/api/dashboard/new_source_spike')
   })
   .catch(console.error);
 /* ── Chart – total pkts every 30 min (all hosts) ─────────────────── */
-fetch('/api/dashboard/rolling_pkt_30m_total')
-  .then(r => r.json())
+widget('rolling_pkt_30m_total')
   .then(data => {
     const labels = data.map(d => {
 		const dt = new Date(d.interval_end);